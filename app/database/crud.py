@@ -1,86 +1,287 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.database.models import Movie, Book, Character
-from typing import List, Dict
+from typing import List, Dict, Optional
+import csv
+import io
+import json
 import pandas as pd
 from datetime import datetime
 
+# Column tuples for the list/search queries: the endpoints and the
+# fallback recommender read these fields and nothing else, so selecting
+# them directly skips ORM instance hydration and leaves unused wide
+# columns (runtime, timestamps, original_language) in the database.
+# Row objects still support attribute access, so callers are unchanged.
+MOVIE_LIST_COLS = (
+    Movie.id, Movie.tmdb_id, Movie.title, Movie.overview, Movie.genres,
+    Movie.release_year, Movie.decade, Movie.vote_average, Movie.vote_count,
+    Movie.popularity, Movie.poster_path, Movie.backdrop_path
+)
+BOOK_LIST_COLS = (
+    Book.id, Book.google_books_id, Book.title, Book.authors,
+    Book.description, Book.categories, Book.average_rating,
+    Book.ratings_count, Book.thumbnail
+)
+
+# Rows per multirow INSERT statement
+UPSERT_CHUNK_SIZE = 1000
+# Below this size the COPY setup isn't worth it over a multirow upsert
+COPY_MIN_ROWS = 5000
+
+
+# Explicit CSV NULL marker: with the default marker an unquoted empty
+# field is NULL, which would silently turn empty strings into NULLs
+_COPY_NULL = '\\N'
+
+
+def _copy_records(db: Session, table, records: List[Dict]) -> None:
+    """
+    Stream records into a table with COPY FROM STDIN (CSV framing).
+    Only safe when no conflicting rows exist, i.e. first-time seeding.
+    """
+    data_cols = list(records[0].keys())
+    cols = list(data_cols)
+    # COPY bypasses the Python-side column defaults the ORM/upsert path
+    # applies, so stamp created_at here to keep the two ingest paths
+    # producing identical rows
+    stamp_created = 'created_at' in table.c and 'created_at' not in cols
+    if stamp_created:
+        cols.append('created_at')
+        created_at = datetime.utcnow()
+
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for rec in records:
+        row = [
+            _COPY_NULL if v is None
+            else json.dumps(v) if isinstance(v, (list, dict))
+            else v
+            for v in (rec[c] for c in data_cols)
+        ]
+        if stamp_created:
+            row.append(created_at)
+        writer.writerow(row)
+    buf.seek(0)
+
+    # Drop below the ORM to the psycopg2 cursor for copy_expert
+    raw_cursor = db.connection().connection.cursor()
+    try:
+        raw_cursor.copy_expert(
+            f"COPY {table.name} ({', '.join(cols)}) FROM STDIN"
+            f" WITH (FORMAT csv, NULL '{_COPY_NULL}')",
+            buf
+        )
+    finally:
+        raw_cursor.close()
+
 def save_movies_bulk(db: Session, movies_df: pd.DataFrame) -> int:
     print(f"[*] Bulk saving {len(movies_df)} movies...")
     count = 0
-    for _, row in movies_df.iterrows():
-        existing = db.query(Movie).filter(Movie.tmdb_id == int(row['tmdb_id'])).first()
-        data = {
-            'title': row['title'],
-            'overview': row.get('overview'),
-            'genres': row.get('genre_names', []),
-            'release_year': int(row['release_year']) if pd.notna(row['release_year']) else None,
-            'decade': int(row['decade']) if pd.notna(row['decade']) else None,
-            'vote_average': float(row['vote_average']) if pd.notna(row['vote_average']) else None,
-            'vote_count': int(row['vote_count']) if pd.notna(row['vote_count']) else None,
-            'popularity': float(row['popularity']) if pd.notna(row['popularity']) else None,
-            'poster_path': row.get('poster_path'),
-            'original_language': row.get('original_language'),
-            'updated_at': datetime.utcnow()
+    # Normalize the whole frame in a few vectorized passes instead of
+    # casting per row: nullable dtypes do the int/float coercion in C,
+    # and one where() turns every NaN/NaT into None
+    movies_df = movies_df.rename(columns={'genre_names': 'genres'})
+    for col in ('overview', 'genres', 'poster_path', 'original_language'):
+        if col not in movies_df.columns:
+            movies_df[col] = None
+    # decade is fully determined by release_year; derive it once in C
+    # instead of trusting (or casting) a per-row value
+    movies_df['decade'] = (
+        pd.to_numeric(movies_df['release_year'], errors='coerce') // 10 * 10
+    )
+    int_cols = ['tmdb_id', 'release_year', 'decade', 'vote_count']
+    float_cols = ['vote_average', 'popularity']
+    movies_df[int_cols] = movies_df[int_cols].astype('Int64')
+    movies_df[float_cols] = movies_df[float_cols].astype('Float64')
+    if 'release_date' in movies_df.columns:
+        movies_df['release_date'] = pd.to_datetime(
+            movies_df['release_date'], errors='coerce'
+        ).dt.strftime('%Y-%m-%d')
+
+    # Remaining fixups as column assignments so to_dict emits rows that
+    # feed the upsert directly, with no per-record touch-up loop
+    movies_df['genres'] = movies_df['genres'].apply(
+        lambda g: g if isinstance(g, list) else []
+    )
+    movies_df['updated_at'] = datetime.utcnow()
+
+    columns = ['tmdb_id', 'title', 'overview', 'genres', 'release_date',
+               'release_year', 'decade', 'vote_average', 'vote_count',
+               'popularity', 'poster_path', 'original_language', 'updated_at']
+    keep = [c for c in columns if c in movies_df.columns]
+    records = movies_df[keep].astype(object).where(movies_df[keep].notna(), None).to_dict(orient='records')
+
+    # First-time seeding of an empty table: COPY skips SQL parsing
+    # entirely and is the fastest ingest path Postgres offers
+    if len(records) > COPY_MIN_ROWS and db.execute(select(Movie.id).limit(1)).first() is None:
+        _copy_records(db, Movie.__table__, records)
+        db.commit()
+        print(f"  COPYed {len(records)} movies")
+        return len(records)
+
+    # One multirow INSERT ... ON CONFLICT DO UPDATE per chunk: the
+    # database decides insert-vs-update, so no per-row SELECT or ORM
+    # flush is needed
+    for i in range(0, len(records), UPSERT_CHUNK_SIZE):
+        chunk = records[i:i + UPSERT_CHUNK_SIZE]
+        stmt = pg_insert(Movie.__table__).values(chunk)
+        update_cols = {
+            key: stmt.excluded[key]
+            for key in chunk[0] if key != 'tmdb_id'
         }
-        if existing:
-            for key, value in data.items():
-                setattr(existing, key, value)
-        else:
-            new_movie = Movie(tmdb_id=int(row['tmdb_id']), **data)
-            db.add(new_movie)
-
-        count += 1
-        if count % 100 == 0:
-            db.commit()
-            print(f"  Processed {count}/{len(movies_df)}")
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=['tmdb_id'],
+            set_=update_cols
+        ))
+        count += len(chunk)
+        print(f"  Processed {count}/{len(records)}")
+    # Single commit: one WAL flush for the whole batch instead of one
+    # per chunk
     db.commit()
     return count
 
 def save_books_bulk(db: Session, books_df: pd.DataFrame) -> int:
     print(f"[*] Bulk saving {len(books_df)} books...")
     count = 0
-    for _, row in books_df.iterrows():
-        existing = db.query(Book).filter(Book.google_books_id == row['google_books_id']).first()
-        data = {
-            'title': row['title'],
-            'authors': row.get('authors', []),
-            'description': row.get('description'),
-            'categories': row.get('categories', []),
-            'published_date': row.get('published_date'),
-            'decade': int(row['decade']) if pd.notna(row['decade']) else None,
-            'page_count': int(row['page_count']) if pd.notna(row['page_count']) else None,
-            'average_rating': float(row['average_rating']) if pd.notna(row['average_rating']) else None,
-            'ratings_count': int(row['ratings_count']) if pd.notna(row['ratings_count']) else None,
-            'thumbnail': row.get('thumbnail'),
-            'publisher': row.get('publisher'),
-            'updated_at': datetime.utcnow()
+    # Same vectorized normalization as save_movies_bulk
+    for col in ('authors', 'description', 'categories', 'published_date',
+                'thumbnail', 'publisher'):
+        if col not in books_df.columns:
+            books_df[col] = None
+    # Derive decade vectorized when the fetcher provided a year column
+    if 'year' in books_df.columns:
+        books_df['decade'] = (
+            pd.to_numeric(books_df['year'], errors='coerce') // 10 * 10
+        )
+    int_cols = ['decade', 'page_count', 'ratings_count']
+    books_df[int_cols] = books_df[int_cols].astype('Int64')
+    books_df['average_rating'] = books_df['average_rating'].astype('Float64')
+
+    for col in ('authors', 'categories'):
+        books_df[col] = books_df[col].apply(
+            lambda v: v if isinstance(v, list) else []
+        )
+    books_df['updated_at'] = datetime.utcnow()
+
+    columns = ['google_books_id', 'title', 'authors', 'description',
+               'categories', 'published_date', 'decade', 'page_count',
+               'average_rating', 'ratings_count', 'thumbnail', 'publisher',
+               'updated_at']
+    keep = [c for c in columns if c in books_df.columns]
+    records = books_df[keep].astype(object).where(books_df[keep].notna(), None).to_dict(orient='records')
+
+    if len(records) > COPY_MIN_ROWS and db.execute(select(Book.id).limit(1)).first() is None:
+        _copy_records(db, Book.__table__, records)
+        db.commit()
+        print(f"  COPYed {len(records)} books")
+        return len(records)
+
+    # Chunked upsert, mirroring save_movies_bulk
+    for i in range(0, len(records), UPSERT_CHUNK_SIZE):
+        chunk = records[i:i + UPSERT_CHUNK_SIZE]
+        stmt = pg_insert(Book.__table__).values(chunk)
+        update_cols = {
+            key: stmt.excluded[key]
+            for key in chunk[0] if key != 'google_books_id'
         }
-        if existing:
-            for key, value in data.items():
-                setattr(existing, key, value)
-        else:
-            new_book = Book(google_books_id=row['google_books_id'], **data)
-            db.add(new_book)
-
-        count += 1
-        if count % 100 == 0:
-            db.commit()
-            print(f"  Processed {count}/{len(books_df)}")
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=['google_books_id'],
+            set_=update_cols
+        ))
+        count += len(chunk)
+        print(f"  Processed {count}/{len(records)}")
     db.commit()
     return count
 
 def get_movie_stats(db: Session) -> Dict:
-    return {'total_movies': db.query(func.count(Movie.id)).scalar()}
+    return {'total_movies': db.scalar(select(func.count(Movie.id)))}
 
 def get_book_stats(db: Session) -> Dict:
-    return {'total_books': db.query(func.count(Book.id)).scalar()}
+    return {'total_books': db.scalar(select(func.count(Book.id)))}
+
+def get_all_movies(
+    db: Session,
+    limit: int = 100,
+    after_popularity: Optional[float] = None,
+    after_id: Optional[int] = None
+) -> List:
+    # Keyset pagination: seeking past the last-seen row uses the
+    # descending popularity index instead of scanning OFFSET rows.
+    # id breaks popularity ties so rows sharing the boundary value
+    # aren't skipped between pages
+    stmt = select(*MOVIE_LIST_COLS).order_by(
+        Movie.popularity.desc().nullslast(),
+        Movie.id.desc()
+    ).limit(limit)
+    if after_popularity is not None and after_id is not None:
+        stmt = stmt.where(
+            tuple_(Movie.popularity, Movie.id) < (after_popularity, after_id)
+        )
+    return db.execute(stmt).all()
+
+def search_movies(db: Session, query: str, limit: int = 100) -> List:
+    # Substring match served by the pg_trgm GIN index on title
+    return db.execute(
+        select(*MOVIE_LIST_COLS).where(
+            Movie.title.ilike(f"%{query}%")
+        ).order_by(Movie.popularity.desc().nullslast()).limit(limit)
+    ).all()
+
+def get_movies_by_genre(db: Session, genre: str, limit: int = 100) -> List:
+    # JSONB containment (genres @> '["Action"]') hits the GIN index and
+    # can't false-match on substrings the way a text LIKE would
+    return db.execute(
+        select(*MOVIE_LIST_COLS).where(
+            Movie.genres.contains([genre])
+        ).order_by(Movie.popularity.desc().nullslast()).limit(limit)
+    ).all()
+
+def get_books_by_category(db: Session, category: str, limit: int = 100) -> List:
+    return db.execute(
+        select(*BOOK_LIST_COLS).where(
+            Book.categories.contains([category])
+        ).order_by(
+            Book.average_rating.desc().nullslast(),
+            Book.ratings_count.desc().nullslast()
+        ).limit(limit)
+    ).all()
+
+def get_all_books(
+    db: Session,
+    limit: int = 100,
+    after_rating: Optional[float] = None,
+    after_ratings_count: Optional[int] = None,
+    after_id: Optional[int] = None
+) -> List:
+    # Keyset over the composite sort key, served by the
+    # (average_rating, ratings_count) index; id breaks ties on the
+    # (rating, count) pair so boundary rows aren't skipped
+    stmt = select(*BOOK_LIST_COLS).order_by(
+        Book.average_rating.desc().nullslast(),
+        Book.ratings_count.desc().nullslast(),
+        Book.id.desc()
+    ).limit(limit)
+    if after_rating is not None and after_ratings_count is not None \
+            and after_id is not None:
+        stmt = stmt.where(
+            tuple_(Book.average_rating, Book.ratings_count, Book.id)
+            < (after_rating, after_ratings_count, after_id)
+        )
+    return db.execute(stmt).all()
+
+# Policy: any query without a LIMIT should go through one of these
+# streaming variants so the whole table is never buffered in memory
 
-def get_all_movies(db: Session, limit: int = 100) -> List[Movie]:
-    return db.query(Movie).order_by(Movie.popularity.desc()).limit(limit).all()
+def stream_movies(db: Session, batch: int = 500):
+    """Iterate every movie using a server-side cursor"""
+    return db.scalars(
+        select(Movie).execution_options(stream_results=True, yield_per=batch)
+    )
 
-def get_all_books(db: Session, limit: int = 100) -> List[Book]:
-    return db.query(Book).order_by(
-        Book.average_rating.desc(),
-        Book.ratings_count.desc()
-    ).limit(limit).all()
+def stream_books(db: Session, batch: int = 500):
+    """Iterate every book using a server-side cursor"""
+    return db.scalars(
+        select(Book).execution_options(stream_results=True, yield_per=batch)
+    )
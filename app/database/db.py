@@ -1,23 +1,49 @@
+import logging
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Keep SQL statement logging off in the hot path: echo-style INFO
+# logging stringifies every statement plus bind params (kilobytes per
+# multirow insert). Raise the level explicitly if debugging locally.
+logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+# pre_ping costs a SELECT 1 round-trip on every checkout; recycling
+# connections before the provider's idle timeout covers steady state.
+# Set DB_POOL_PRE_PING=true behind proxies that kill idle connections
+# aggressively.
+POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"
+
 engine = create_engine(
     DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=300,
+    pool_pre_ping=POOL_PRE_PING,
+    pool_recycle=1800,
+    pool_use_lifo=True,
     pool_size=5,
-    max_overflow=10
+    max_overflow=10,
+    # psycopg2 fast-execution helpers: batch executemany parameter sets
+    # into multirow statements instead of one round-trip per row
+    executemany_mode="values_plus_batch",
+    executemany_batch_page_size=500,
+    insertmanyvalues_page_size=1000
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
+
+def init_db():
+    """Create all tables defined on the models' Base metadata"""
+    from app.database.models import Base
+    # movies_title_trgm uses gin_trgm_ops, so the extension must exist
+    # before create_all builds the index on a fresh database
+    with engine.begin() as connection:
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    Base.metadata.create_all(bind=engine)
+
 def get_db():
     db = SessionLocal()
     try:
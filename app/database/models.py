@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Float, JSON, DateTime, Boolean, Text
+from sqlalchemy import Column, Integer, String, Float, JSON, DateTime, Boolean, Text, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
 
@@ -10,12 +11,25 @@ class Movie(Base):
     Table to store movie data from TMDB
     """
     __tablename__ = 'movies'
+    __table_args__ = (
+        # GIN index so genre containment (genres @> '["Action"]') is an
+        # index lookup instead of a full scan
+        Index('movies_genres_gin', 'genres', postgresql_using='gin'),
+        # ORDER BY popularity DESC LIMIT n becomes an index scan that
+        # yields rows already ordered
+        Index('ix_movies_pop_desc', text('popularity DESC NULLS LAST')),
+        # Trigram index so substring title search (ILIKE '%...%') is an
+        # index lookup; needs CREATE EXTENSION pg_trgm on the database
+        Index('movies_title_trgm', 'title',
+              postgresql_using='gin',
+              postgresql_ops={'title': 'gin_trgm_ops'}),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     tmdb_id = Column(Integer, unique=True, index=True)  # TMDB's ID
     title = Column(String(500), nullable=False)
     overview = Column(Text)  # Movie description
-    genres = Column(JSON)  # ["action", "sci-fi", "thriller"]
+    genres = Column(JSONB)  # ["action", "sci-fi", "thriller"]
     release_date = Column(String(50))
     release_year = Column(Integer, index=True)
     decade = Column(Integer, index=True)  # 1990, 2000, 2010, 2020
@@ -38,13 +52,20 @@ class Book(Base):
     Table to store book data from Google Books API
     """
     __tablename__ = 'books'
+    __table_args__ = (
+        Index('books_categories_gin', 'categories', postgresql_using='gin'),
+        # Matches the get_all_books ordering
+        Index('ix_books_rating_count',
+              text('average_rating DESC NULLS LAST'),
+              text('ratings_count DESC NULLS LAST')),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     google_books_id = Column(String(100), unique=True, index=True)
     title = Column(String(500), nullable=False)
     authors = Column(JSON)  # ["Author 1", "Author 2"]
     description = Column(Text)
-    categories = Column(JSON)  # ["Fiction", "Fantasy"]
+    categories = Column(JSONB)  # ["Fiction", "Fantasy"]
     published_date = Column(String(50))
     decade = Column(Integer, index=True)
     page_count = Column(Integer)
@@ -68,7 +89,9 @@ class Character(Base):
     __tablename__ = 'characters'
 
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(200), nullable=False, index=True)
+    # Unique: seeding relies on INSERT .. ON CONFLICT (name) instead
+    # of check-then-insert round-trips
+    name = Column(String(200), nullable=False, unique=True, index=True)
     type = Column(String(20), index=True)  # 'anime' or 'actor'
     alignment = Column(String(20))  # 'hero', 'villain', 'anti-hero'
     traits = Column(JSON)  # ["funny", "powerful", "intelligent"]
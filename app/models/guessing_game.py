@@ -1,76 +1,197 @@
-from typing import List, Dict, Optional
+import heapq
+import logging
+import numpy as np
+from typing import List, Dict, Optional, NamedTuple
+from collections import OrderedDict
+from threading import Lock
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from app.database.models import Character
 import uuid
-from sqlalchemy import cast, String
+
+logger = logging.getLogger(__name__)
+
+
+class CharacterRow(NamedTuple):
+    """Lightweight snapshot of the Character columns the game reads"""
+    id: int
+    name: str
+    type: str
+    alignment: Optional[str]
+    traits: Optional[list]
+    genres: Optional[list]
+    popularity_score: Optional[float]
+    source: Optional[str]
+    image_url: Optional[str]
+    additional_info: Optional[dict]
+
+
+# Game state per active session: the character snapshot plus the
+# current candidate ids, so clients don't have to round-trip candidate
+# lists and each answer filters in memory instead of re-querying the
+# DB. Capped so abandoned sessions don't accumulate; oldest entries are
+# evicted first.
+MAX_CACHED_SESSIONS = 1024
+_sessions: "OrderedDict[str, Dict]" = OrderedDict()
+_session_lock = Lock()
+
+
+def _cache_session(session_id: str, state: Dict) -> None:
+    with _session_lock:
+        _sessions[session_id] = state
+        _sessions.move_to_end(session_id)
+        while len(_sessions) > MAX_CACHED_SESSIONS:
+            _sessions.popitem(last=False)
+
+
+def _get_cached_session(session_id: str) -> Optional[Dict]:
+    with _session_lock:
+        state = _sessions.get(session_id)
+        if state is not None:
+            _sessions.move_to_end(session_id)
+        return state
+
+
+# Built once at import: the tree is read-only, so rebuilding it (and
+# its nested dicts) on every request-scoped instantiation was pure
+# allocation churn
+QUESTION_TREE = (
+    {
+        "id": 1,
+        "question": "Is this character from anime or a real actor?",
+        "field": "type",
+        "type": "exact",
+        "options": ("anime", "actor")
+    },
+    {
+        "id": 2,
+        "question": "What gender is this character?",
+        "field": "additional_info.gender",
+        "type": "nested",
+        "options": ("male", "female")
+    },
+    {
+        "id": 3,
+        "question": "Is this character a hero, villain, or anti-hero?",
+        "field": "alignment",
+        "type": "exact",
+        "options": ("hero", "villain", "anti-hero"),
+        "condition": {"type": "anime"}
+    },
+    {
+        "id": 4,
+        "question": "Which trait best describes this character?",
+        "field": "traits",
+        "type": "contains",
+        "options": ("funny", "serious", "determined", "intelligent",
+                    "mysterious", "strong", "charismatic")
+    },
+    {
+        "id": 5,
+        "question": "What genre is their main work?",
+        "field": "genres",
+        "type": "contains",
+        "options": ("action", "comedy", "drama", "thriller",
+                    "sci-fi", "adventure", "mystery")
+    },
+    {
+        "id": 6,
+        "question": "Does this character have any special powers or abilities?",
+        "field": "traits",
+        "type": "contains",
+        "options": ("powerful", "skilled", "intelligent", "charismatic"),
+        "condition": {"type": "anime"}
+    },
+    {
+        "id": 7,
+        "question": "How popular/famous is this character?",
+        "field": "popularity_score",
+        "type": "range",
+        "options": {
+            "Extremely famous (everyone knows them)": (95, 100),
+            "Very famous": (90, 94),
+            "Well-known": (85, 89),
+            "Moderately known": (0, 84)
+        }
+    }
+)
 
 
 class CharacterGuessingGame:
     def __init__(self, db: Session):
         self.db = db
-        self.question_tree = self._build_question_tree()
-
-    def _build_question_tree(self) -> List[Dict]:
-        return [
-        {
-            "id": 1,
-            "question": "Is this character from anime or a real actor?",
-            "field": "type",
-            "type": "exact",
-            "options": ["anime", "actor"]
-        },
-        {
-            "id": 2,
-            "question": "What gender is this character?",
-            "field": "additional_info.gender",
-            "type": "nested",
-            "options": ["male", "female"]
-        },
-        {
-            "id": 3,
-            "question": "Is this character a hero, villain, or anti-hero?",
-            "field": "alignment",
-            "type": "exact",
-            "options": ["hero", "villain", "anti-hero"],
-            "condition": {"type": "anime"}
-        },
-        {
-            "id": 4,
-            "question": "Which trait best describes this character?",
-            "field": "traits",
-            "type": "contains",
-            "options": ["funny", "serious", "determined", "intelligent",
-                       "mysterious", "strong", "charismatic"]
-        },
-        {
-            "id": 5,
-            "question": "What genre is their main work?",
-            "field": "genres",
-            "type": "contains",
-            "options": ["action", "comedy", "drama", "thriller",
-                       "sci-fi", "adventure", "mystery"]
-        },
-        {
-            "id": 6,
-            "question": "Does this character have any special powers or abilities?",
-            "field": "traits",
-            "type": "contains",
-            "options": ["powerful", "skilled", "intelligent", "charismatic"],
-            "condition": {"type": "anime"}
-        },
-        {
-            "id": 7,
-            "question": "How popular/famous is this character?",
-            "field": "popularity_score",
-            "type": "range",
-            "options": {
-                "Extremely famous (everyone knows them)": (95, 100),
-                "Very famous": (90, 94),
-                "Well-known": (85, 89),
-                "Moderately known": (0, 84)
+        self.question_tree = QUESTION_TREE
+
+    def _load_characters(self) -> List[CharacterRow]:
+        # Column tuples, not full ORM objects: skips attribute
+        # instrumentation and leaves unused columns in the DB
+        rows = self.db.execute(select(
+            Character.id, Character.name, Character.type,
+            Character.alignment, Character.traits, Character.genres,
+            Character.popularity_score, Character.source,
+            Character.image_url, Character.additional_info
+        )).all()
+        return [CharacterRow(*row) for row in rows]
+
+    @staticmethod
+    def _build_state(
+        characters: List[CharacterRow],
+        candidate_ids: Optional[List[int]] = None
+    ) -> Dict:
+        """
+        Build session state: the character snapshot, the live candidate
+        set, and inverted indices field -> answer -> ids so each filter
+        is a single C-level set intersection instead of a Python scan.
+        """
+        indices: Dict[str, Dict] = {
+            'type': {}, 'alignment': {}, 'additional_info.gender': {},
+            'traits': {}, 'genres': {}
+        }
+        for char in characters:
+            if char.type:
+                indices['type'].setdefault(char.type, set()).add(char.id)
+            if char.alignment:
+                indices['alignment'].setdefault(char.alignment, set()).add(char.id)
+            gender = char.additional_info.get('gender') if char.additional_info else None
+            if gender:
+                indices['additional_info.gender'].setdefault(gender, set()).add(char.id)
+            for trait in char.traits or []:
+                indices['traits'].setdefault(trait, set()).add(char.id)
+            for genre in char.genres or []:
+                indices['genres'].setdefault(genre, set()).add(char.id)
+
+        # Bucket the numeric range questions up front with vectorized
+        # masks, so answering one is the same posting-set intersection
+        # as the categorical questions — no per-candidate comparisons
+        for question in QUESTION_TREE:
+            if question['type'] != 'range':
+                continue
+            field = question['field']
+            ids = np.array([char.id for char in characters], dtype=np.int64)
+            values = np.array(
+                [getattr(char, field, 0) or 0 for char in characters],
+                dtype=float
+            )
+            indices[field] = {
+                label: set(ids[(values >= min_val) & (values <= max_val)].tolist())
+                for label, (min_val, max_val) in question['options'].items()
             }
+
+        return {
+            'characters': characters,
+            'candidates': set(candidate_ids) if candidate_ids
+                          else {char.id for char in characters},
+            'indices': indices
         }
-    ]
+
+    def _get_session_state(self, session_id: str, candidate_ids: Optional[List[int]] = None) -> Dict:
+        state = _get_cached_session(session_id)
+        if state is None:
+            # Cache miss (restart or eviction): reload once; a legacy
+            # client's candidate list restores the narrowed state
+            state = self._build_state(self._load_characters(), candidate_ids)
+            _cache_session(session_id, state)
+        return state
 
     def start_game(self) -> Dict:
         """
@@ -86,12 +207,14 @@ class CharacterGuessingGame:
         """
         session_id = str(uuid.uuid4())
 
-        # Get all characters as initial candidates
-        all_characters = self.db.query(Character).all()
-        candidate_ids = [char.id for char in all_characters]
+        # One query per game: every later answer filters this snapshot,
+        # and the candidate set lives server-side from here on
+        state = self._build_state(self._load_characters())
+        _cache_session(session_id, state)
+        total_candidates = len(state['candidates'])
 
-        print(f"[*] Started new game session: {session_id}")
-        print(f"[*] Initial candidates: {len(candidate_ids)}")
+        logger.debug("Started new game session: %s", session_id)
+        logger.debug("Initial candidates: %d", total_candidates)
 
         # Get first question
         first_question = self.question_tree[0]
@@ -101,7 +224,7 @@ class CharacterGuessingGame:
             'question': first_question['question'],
             'options': first_question['options'],
             'question_number': 1,
-            'total_candidates': len(candidate_ids)
+            'total_candidates': total_candidates
         }
 
     def answer_question(
@@ -109,25 +232,28 @@ class CharacterGuessingGame:
     session_id: str,
     question_number: int,
     answer: str,
-    candidate_ids: List[int]
+    candidate_ids: Optional[List[int]] = None
     ) -> Dict:
         question = self.question_tree[question_number - 1]
 
-        print(f"[*] Session {session_id[:8]}...")
-        print(f"[*] Question {question_number}: {question['question']}")
-        print(f"[*] Answer: {answer}")
-        print(f"[*] Candidates before filtering: {len(candidate_ids)}")
+        # The server-side session state is authoritative; the optional
+        # candidate_ids only seeds it after a cache miss
+        state = self._get_session_state(session_id, candidate_ids)
+        characters = state['characters']
+        current_candidates = state['candidates']
 
-        new_candidates = self._filter_candidates(
-            candidate_ids,
-            question,
-            answer
-        )
+        logger.debug("Session %s...", session_id[:8])
+        logger.debug("Question %d: %s", question_number, question['question'])
+        logger.debug("Answer: %s", answer)
+        logger.debug("Candidates before filtering: %d", len(current_candidates))
+
+        new_candidates = self._filter_candidates(state, question, answer)
+        state['candidates'] = new_candidates
 
-        print(f"[*] Candidates after filtering: {len(new_candidates)}")
+        logger.debug("Candidates after filtering: %d", len(new_candidates))
 
         if len(new_candidates) <= 1 or question_number >= len(self.question_tree):
-            return self._make_guess(new_candidates, question_number)
+            return self._make_guess(characters, new_candidates, question_number)
 
         next_question_idx = question_number
 
@@ -135,14 +261,14 @@ class CharacterGuessingGame:
             next_q = self.question_tree[next_question_idx]
 
             if 'condition' in next_q:
-                if not self._check_condition(next_q['condition'], new_candidates):
+                if not self._check_condition(next_q['condition'], characters, new_candidates):
                     next_question_idx += 1
                     continue
 
             break
 
         if next_question_idx >= len(self.question_tree):
-            return self._make_guess(new_candidates, question_number)
+            return self._make_guess(characters, new_candidates, question_number)
 
         next_q = self.question_tree[next_question_idx]
 
@@ -152,70 +278,41 @@ class CharacterGuessingGame:
             'options': next_q['options'],
             'question_number': next_question_idx + 1,
             'remaining_candidates': len(new_candidates),
-            'candidate_ids': new_candidates
+            'candidate_ids': sorted(new_candidates)
         }
     def _filter_candidates(
         self,
-        candidate_ids: List[int],
+        state: Dict,
         question: Dict,
         answer: str
-    ) -> List[int]:
-        # Get current candidates
-        candidates = self.db.query(Character).filter(
-            Character.id.in_(candidate_ids)
-        ).all()
-
-        filtered = []
+    ) -> set:
+        candidate_set = state['candidates']
         field = question['field']
-        q_type = question['type']
 
-        for char in candidates:
-            match = False
-
-            if q_type == 'exact':
-                # Exact field match
-                value = getattr(char, field, None)
-                if value == answer:
-                    match = True
-
-            elif q_type == 'nested':
-                # Nested field (e.g., additional_info.gender)
-                if field == 'additional_info.gender':
-                    gender = char.additional_info.get('gender') if char.additional_info else None
-                    if gender == answer:
-                        match = True
-
-            elif q_type == 'contains':
-                # List field contains answer
-                value = getattr(char, field, [])
-                if isinstance(value, list) and answer in value:
-                    match = True
-
-            elif q_type == 'range':
-                # Numeric range
-                value = getattr(char, field, 0)
-                ranges = question['options']
-                if answer in ranges:
-                    min_val, max_val = ranges[answer]
-                    if min_val <= value <= max_val:
-                        match = True
-
-            if match:
-                filtered.append(char.id)
+        # Every question type — exact, nested, contains and range (its
+        # bands are precomputed at state build) — collapses to one
+        # posting-set lookup plus a C-level intersection
+        matched = state['indices'].get(field, {}).get(answer)
+        filtered = candidate_set & matched if matched else set()
 
         # Fallback: if no matches, return all (avoid dead end)
-        return filtered if filtered else candidate_ids
+        return filtered if filtered else candidate_set
 
-    def _check_condition(self, condition: Dict, candidate_ids: List[int]) -> bool:
+    def _check_condition(
+        self,
+        condition: Dict,
+        characters: List[CharacterRow],
+        candidate_ids: set
+    ) -> bool:
         if not candidate_ids:
             return False
 
-        # Get a sample candidate
-        sample = self.db.query(Character).filter(
-            Character.id == candidate_ids[0]
-        ).first()
+        # Get a sample candidate from the session snapshot — it was
+        # just filtered, so there's nothing to re-fetch from the DB
+        sample_id = next(iter(candidate_ids))
+        sample = next((char for char in characters if char.id == sample_id), None)
 
-        if not sample:
+        if sample is None:
             return False
 
         # Check condition
@@ -225,13 +322,22 @@ class CharacterGuessingGame:
 
         return True
 
-    def _make_guess(self, candidate_ids: List[int], questions_asked: int) -> Dict:
+    def _make_guess(
+        self,
+        characters: List[CharacterRow],
+        candidate_ids: set,
+        questions_asked: int
+    ) -> Dict:
         """
         Make final guess(es) based on remaining candidates
         """
-        candidates = self.db.query(Character).filter(
-            Character.id.in_(candidate_ids)
-        ).order_by(Character.popularity_score.desc()).limit(3).all()
+        # Partial selection: O(N log 3) instead of sorting every
+        # candidate to keep three
+        candidates = heapq.nlargest(
+            3,
+            (char for char in characters if char.id in candidate_ids),
+            key=lambda char: char.popularity_score or 0
+        )
 
         guesses = []
         for char in candidates:
@@ -245,8 +351,8 @@ class CharacterGuessingGame:
                 'image_url': char.image_url
             })
 
-        print(f"[*] Making guess with {len(candidates)} candidates")
-        print(f"[*] Top guess: {guesses[0]['name'] if guesses else 'None'}")
+        logger.debug("Making guess with %d candidates", len(candidates))
+        logger.debug("Top guess: %s", guesses[0]['name'] if guesses else 'None')
 
         return {
             'status': 'guess',
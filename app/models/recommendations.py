@@ -3,40 +3,66 @@ Movie/Book Recommendation Engine
 Content-Based Filtering with Weighted Scoring
 """
 from typing import List, Dict, Optional
-import pandas as pd
-from sqlalchemy.orm import Session
+import logging
+import time
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session, load_only
 from app.database.models import Movie, Book
 from app.database.crud import get_all_movies
 
+# The columns the engine reads and returns; loading only these keeps
+# wide unused fields (runtime, timestamps, original_language) in the DB
+MOVIE_FIELDS = (
+    Movie.id, Movie.tmdb_id, Movie.title, Movie.overview, Movie.genres,
+    Movie.release_year, Movie.decade, Movie.vote_average, Movie.vote_count,
+    Movie.popularity, Movie.poster_path, Movie.backdrop_path
+)
+
+# The catalog slice backing /recommendations only changes when a fetch
+# script runs, yet every request re-queried the top 1000 movies. Cache
+# it per process alongside the numeric columns the scorer reads, so a
+# warm request touches no SQL and allocates no new arrays.
+CATALOG_TTL = 600  # seconds
+_catalog_cache = {'expires': 0.0, 'catalog': None}
+
+# Neighbors precomputed per catalog refresh (see _build_similar_topk)
+SIMILAR_TOPK = 20
+
+logger = logging.getLogger(__name__)
+
 
 class RecommendationEngine:
     """
     Content-based recommendation system
     Matches user preferences to content using weighted scoring
-    """
-
-    def __init__(self, db: Session):
-        self.db = db
 
-        # Mood to genre mapping
-        self.mood_map = {
-            'intense': ['Action', 'Thriller', 'Horror', 'War'],
-            'light-hearted': ['Comedy', 'Animation', 'Family', 'Romance'],
-            'thought-provoking': ['Drama', 'Mystery', 'Science Fiction', 'Documentary'],
-            'emotional': ['Drama', 'Romance', 'Family'],
-            'suspenseful': ['Thriller', 'Mystery', 'Horror', 'Crime']
-        }
+    Stateless apart from module-level caches, so one instance is built
+    at import and shared by every request; the Session rides along as
+    a per-call argument instead of being baked into the instance.
+    """
 
-        # Setting to genre mapping
-        self.setting_map = {
-            'modern': ['Action', 'Thriller', 'Crime', 'Drama'],
-            'historical': ['History', 'War', 'Drama'],
-            'futuristic': ['Science Fiction', 'Fantasy'],
-            'fantasy_world': ['Fantasy', 'Adventure', 'Animation']
-        }
+    # Mood to genre mapping (frozensets: intersections and
+    # membership checks run at C level)
+    mood_map = {
+        'intense': frozenset(['Action', 'Thriller', 'Horror', 'War']),
+        'light-hearted': frozenset(['Comedy', 'Animation', 'Family', 'Romance']),
+        'thought-provoking': frozenset(['Drama', 'Mystery', 'Science Fiction', 'Documentary']),
+        'emotional': frozenset(['Drama', 'Romance', 'Family']),
+        'suspenseful': frozenset(['Thriller', 'Mystery', 'Horror', 'Crime'])
+    }
+
+    # Setting to genre mapping
+    setting_map = {
+        'modern': frozenset(['Action', 'Thriller', 'Crime', 'Drama']),
+        'historical': frozenset(['History', 'War', 'Drama']),
+        'futuristic': frozenset(['Science Fiction', 'Fantasy']),
+        'fantasy_world': frozenset(['Fantasy', 'Adventure', 'Animation'])
+    }
 
     def recommend_movies(
         self,
+        db: Session,
         genres: Optional[List[str]] = None,
         decade: Optional[str] = None,
         mood: Optional[str] = None,
@@ -62,14 +88,61 @@ class RecommendationEngine:
                 'total_candidates': 99
             }
         """
-        print(f"[*] Getting recommendations with preferences:")
-        print(f"    Genres: {genres}")
-        print(f"    Decade: {decade}")
-        print(f"    Mood: {mood}")
-        print(f"    Setting: {setting}")
+        logger.debug(
+            "Getting recommendations: genres=%s decade=%s mood=%s setting=%s",
+            genres, decade, mood, setting
+        )
 
-        # Get all movies
-        all_movies = get_all_movies(self.db, limit=1000)
+        # Candidates come from the process-level catalog cache. Filter
+        # first, score second: when the request names genres (directly
+        # or via mood/setting), only movies carrying at least one of
+        # them can beat the score floor, so the inverted index prunes
+        # the rest before any scoring work. Decade stays a soft
+        # preference handled by scoring.
+        catalog = self._get_catalog(db)
+        # Parse the user-supplied inputs once at the boundary: decade
+        # string to int, genre list to frozenset, mood/setting to their
+        # genre sets. Everything below works on these parsed forms.
+        decade_num = int(decade[:4]) if decade else None
+        genres_set = frozenset(genres or ())
+        mood_set = self.mood_map.get(mood, frozenset()) if mood else frozenset()
+        setting_set = self.setting_map.get(setting, frozenset()) if setting else frozenset()
+        wanted_genres = genres_set | mood_set | setting_set
+
+        mask = None
+        if wanted_genres:
+            genre_to_idx = catalog['genre_to_idx']
+            hits = [genre_to_idx[g] for g in wanted_genres if g in genre_to_idx]
+            if hits:
+                mask = np.zeros(len(catalog['movies']), dtype=bool)
+                mask[np.concatenate(hits)] = True
+        if min_rating:
+            rating_mask = catalog['ratings'] >= min_rating
+            mask = rating_mask if mask is None else mask & rating_mask
+
+        # Per-row hit counts for each preference set, built by a few
+        # scatter-adds over the inverted index (one per wanted genre)
+        # rather than a Python set intersection per candidate
+        genre_counts = self._genre_hit_counts(catalog, genres_set)
+        mood_counts = self._genre_hit_counts(catalog, mood_set)
+        setting_counts = self._genre_hit_counts(catalog, setting_set)
+
+        if mask is not None and not mask.all():
+            keep = np.flatnonzero(mask)
+            movies = [catalog['movies'][i] for i in keep]
+            decades = catalog['decades'][keep]
+            ratings = catalog['ratings'][keep]
+            if genre_counts is not None:
+                genre_counts = genre_counts[keep]
+            if mood_counts is not None:
+                mood_counts = mood_counts[keep]
+            if setting_counts is not None:
+                setting_counts = setting_counts[keep]
+        else:
+            movies = catalog['movies']
+            decades = catalog['decades']
+            ratings = catalog['ratings']
+        all_movies = movies
 
         if not all_movies:
             return {
@@ -78,62 +151,39 @@ class RecommendationEngine:
                 'total_candidates': 0
             }
 
-        # Convert to DataFrame for easier manipulation
-        movies_data = []
-        for movie in all_movies:
-            movies_data.append({
-                'id': movie.id,
-                'tmdb_id': movie.tmdb_id,
-                'title': movie.title,
-                'overview': movie.overview,
-                'genres': movie.genres,
-                'release_year': movie.release_year,
-                'decade': movie.decade,
-                'vote_average': movie.vote_average,
-                'vote_count': movie.vote_count,
-                'popularity': movie.popularity,
-                'poster_path': movie.poster_path,
-                'backdrop_path': movie.backdrop_path
-            })
-
-        df = pd.DataFrame(movies_data)
-
-        # Calculate match scores
-        df['score'] = df.apply(
-            lambda row: self._calculate_movie_score(
-                row, genres, decade, mood, setting, min_rating
-            ),
-            axis=1
+        # Score straight off the row list: building a DataFrame (block
+        # manager, index, dtype inference) just to sort and slice it
+        # cost more than the scoring itself. Dicts are built only for
+        # the top-N rows that actually leave the function.
+        scores = self._score_movies(
+            len(all_movies), decades, ratings, decade_num,
+            genre_counts, len(genres_set),
+            mood_counts, len(mood_set),
+            setting_counts, len(setting_set)
         )
 
-        # Filter by minimum rating if specified
-        if min_rating:
-            df = df[df['vote_average'] >= min_rating]
-
-        # Sort by score
-        df = df.sort_values('score', ascending=False)
+        # Top-N via argpartition (O(N)) then order just those N
+        top_n = min(top_n, len(all_movies))
+        top_idx = np.argpartition(-scores, top_n - 1)[:top_n]
+        top_idx = top_idx[np.argsort(-scores[top_idx])]
 
         # Determine match quality
-        top_scores = df.head(top_n)['score'].values
-        if len(top_scores) > 0:
-            avg_score = top_scores.mean()
-            if avg_score >= 7.0:
-                match_quality = 'high'
-            elif avg_score >= 4.0:
-                match_quality = 'medium'
-            else:
-                match_quality = 'low'
+        avg_score = scores[top_idx].mean()
+        if avg_score >= 7.0:
+            match_quality = 'high'
+        elif avg_score >= 4.0:
+            match_quality = 'medium'
         else:
-            match_quality = 'none'
+            match_quality = 'low'
 
-        # Get top N recommendations
-        recommendations = df.head(top_n).to_dict('records')
-
-        # Add match reasons
-        for rec in recommendations:
+        recommendations = []
+        for i in top_idx:
+            rec = self._movie_dict(all_movies[i])
+            rec['score'] = float(scores[i])
             rec['match_reason'] = self._get_match_reason(
-                rec, genres, decade, mood, setting
+                rec, genres, decade_num, mood, setting
             )
+            recommendations.append(rec)
 
         return {
             'recommendations': recommendations,
@@ -141,17 +191,110 @@ class RecommendationEngine:
             'total_candidates': len(all_movies)
         }
 
-    def _calculate_movie_score(
-        self,
-        movie: pd.Series,
-        genres: Optional[List[str]],
-        decade: Optional[str],
-        mood: Optional[str],
-        setting: Optional[str],
-        min_rating: Optional[float]
-    ) -> float:
+    def _get_catalog(self, db: Session) -> Dict:
+        """
+        Return the cached top-1000 catalog slice, refreshing it from
+        the DB when the TTL lapses. Numeric columns are materialized
+        once here so the per-request scorer works on ready arrays.
+        """
+        now = time.monotonic()
+        catalog = _catalog_cache['catalog']
+        if catalog is None or now >= _catalog_cache['expires']:
+            movies = db.scalars(
+                select(Movie).options(
+                    load_only(*MOVIE_FIELDS)
+                ).order_by(Movie.popularity.desc().nullslast()).limit(1000)
+            ).all()
+            # Inverted index genre -> row positions, so genre-driven
+            # requests score only the movies that can actually match
+            genre_to_idx: Dict[str, List[int]] = {}
+            for i, movie in enumerate(movies):
+                for g in movie.genres or []:
+                    genre_to_idx.setdefault(g, []).append(i)
+            # Row-normalized multi-hot genre matrix: cosine similarity
+            # against any probe vector is then one BLAS matrix-vector
+            # product instead of a per-movie Python loop
+            genre_vocab = {g: j for j, g in enumerate(genre_to_idx)}
+            genre_matrix = np.zeros((len(movies), max(len(genre_vocab), 1)),
+                                    dtype=np.float32)
+            for g, rows in genre_to_idx.items():
+                genre_matrix[rows, genre_vocab[g]] = 1.0
+            norms = np.linalg.norm(genre_matrix, axis=1, keepdims=True)
+            genre_matrix /= np.maximum(norms, 1e-9)
+            catalog = {
+                'movies': movies,
+                'decades': np.array([m.decade or 0 for m in movies], dtype=float),
+                'ratings': np.array([m.vote_average or 0 for m in movies], dtype=float),
+                'popularity': np.array([m.popularity or 0 for m in movies], dtype=float),
+                'genre_to_idx': {
+                    g: np.array(idx, dtype=np.int32)
+                    for g, idx in genre_to_idx.items()
+                },
+                'genre_vocab': genre_vocab,
+                'genre_matrix': np.ascontiguousarray(genre_matrix),
+                'id_to_row': {m.id: i for i, m in enumerate(movies)}
+            }
+            # Similar-movie lookups rarely change between refreshes, so
+            # compute every movie's top neighbors here in one batched
+            # N x N pass; the request path becomes an array slice
+            catalog['similar_rows'], catalog['similar_scores'] = (
+                self._build_similar_topk(catalog)
+            )
+            _catalog_cache['catalog'] = catalog
+            _catalog_cache['expires'] = now + CATALOG_TTL
+        return catalog
+
+    @staticmethod
+    def _movie_dict(movie: Movie) -> Dict:
+        """Response payload for one movie row"""
+        return {
+            'id': movie.id,
+            'tmdb_id': movie.tmdb_id,
+            'title': movie.title,
+            'overview': movie.overview,
+            'genres': movie.genres,
+            'release_year': movie.release_year,
+            'decade': movie.decade,
+            'vote_average': movie.vote_average,
+            'vote_count': movie.vote_count,
+            'popularity': movie.popularity,
+            'poster_path': movie.poster_path,
+            'backdrop_path': movie.backdrop_path
+        }
+
+    @staticmethod
+    def _genre_hit_counts(catalog: Dict, genre_set: frozenset) -> Optional[np.ndarray]:
+        """
+        Per-row count of how many genres in genre_set each catalog
+        movie carries, accumulated over the inverted index: one
+        vectorized add per wanted genre instead of a set intersection
+        per movie. Returns None for an empty set.
+        """
+        if not genre_set:
+            return None
+        counts = np.zeros(len(catalog['movies']), dtype=float)
+        genre_to_idx = catalog['genre_to_idx']
+        for g in genre_set:
+            rows = genre_to_idx.get(g)
+            if rows is not None:
+                counts[rows] += 1.0
+        return counts
+
+    @staticmethod
+    def _score_movies(
+        n: int,
+        decades: np.ndarray,
+        ratings: np.ndarray,
+        decade_num: Optional[int],
+        genre_counts: Optional[np.ndarray],
+        n_genres: int,
+        mood_counts: Optional[np.ndarray],
+        n_mood: int,
+        setting_counts: Optional[np.ndarray],
+        n_setting: int
+    ) -> np.ndarray:
         """
-        Calculate match score for a movie (0-10 scale)
+        Calculate match scores for all movies at once (0-10 scale)
 
         Weighting:
         - Genre match: 40%
@@ -160,59 +303,44 @@ class RecommendationEngine:
         - Setting match: 10%
         - Quality (rating): 15%
         """
-        score = 0.0
-        movie_genres = movie['genres'] if isinstance(movie['genres'], list) else []
-
         # 1. Genre Match (40% weight) - most important
-        if genres:
-            genre_matches = sum(1 for g in genres if g in movie_genres)
-            genre_score = (genre_matches / len(genres)) * 4.0
-            score += genre_score
+        if genre_counts is not None:
+            score = genre_counts / n_genres * 4.0
         else:
-            score += 2.0  # Neutral score if no genre preference
-
-        # 2. Decade Match (15% weight)
-        if decade:
-            decade_num = int(decade[:4]) if decade else None
-            if decade_num and movie['decade'] == decade_num:
-                score += 1.5  # Exact decade match
-            elif decade_num and abs(movie['decade'] - decade_num) == 10:
-                score += 0.75  # Adjacent decade (partial match)
+            score = np.full(n, 2.0)  # Neutral score
+
+        # 2. Decade Match (15% weight): exact 1.5, adjacent 0.75
+        if decade_num:
+            decade_diff = np.abs(decades - decade_num)
+            score = score + np.where(
+                decade_diff == 0, 1.5,
+                np.where(decade_diff == 10, 0.75, 0.0)
+            )
         else:
-            score += 0.75  # Neutral score
+            score = score + 0.75  # Neutral score
 
         # 3. Mood Match (20% weight)
-        if mood and mood in self.mood_map:
-            mood_genres = self.mood_map[mood]
-            mood_matches = sum(1 for g in mood_genres if g in movie_genres)
-            mood_score = (mood_matches / len(mood_genres)) * 2.0
-            score += mood_score
+        if mood_counts is not None:
+            score = score + mood_counts / n_mood * 2.0
         else:
-            score += 1.0  # Neutral score
+            score = score + 1.0  # Neutral score
 
         # 4. Setting Match (10% weight)
-        if setting and setting in self.setting_map:
-            setting_genres = self.setting_map[setting]
-            setting_matches = sum(1 for g in setting_genres if g in movie_genres)
-            setting_score = (setting_matches / len(setting_genres)) * 1.0
-            score += setting_score
+        if setting_counts is not None:
+            score = score + setting_counts / n_setting * 1.0
         else:
-            score += 0.5  # Neutral score
+            score = score + 0.5  # Neutral score
 
         # 5. Quality Score (15% weight) - based on rating
-        if pd.notna(movie['vote_average']) and movie['vote_average'] > 0:
-            rating = movie['vote_average']
-            # Normalize rating to 0-1.5 scale
-            quality_score = (rating / 10.0) * 1.5
-            score += quality_score
+        score = score + np.clip(ratings, 0, None) / 10.0 * 1.5
 
-        return round(score, 2)
+        return np.round(score, 2)
 
     def _get_match_reason(
         self,
         movie: Dict,
         genres: Optional[List[str]],
-        decade: Optional[str],
+        decade_num: Optional[int],
         mood: Optional[str],
         setting: Optional[str]
     ) -> str:
@@ -220,7 +348,7 @@ class RecommendationEngine:
         Generate human-readable reason for recommendation
         """
         reasons = []
-        movie_genres = movie['genres'] if isinstance(movie['genres'], list) else []
+        movie_genres = frozenset(movie['genres']) if isinstance(movie['genres'], list) else frozenset()
 
         # Genre matches
         if genres:
@@ -229,10 +357,8 @@ class RecommendationEngine:
                 reasons.append(f"Matches your genre preferences: {', '.join(matched_genres)}")
 
         # Decade match
-        if decade:
-            decade_num = int(decade[:4])
-            if movie['decade'] == decade_num:
-                reasons.append(f"From your preferred decade ({decade})")
+        if decade_num and movie['decade'] == decade_num:
+            reasons.append(f"From your preferred decade ({decade_num}s)")
 
         # Mood match
         if mood and mood in self.mood_map:
@@ -241,55 +367,118 @@ class RecommendationEngine:
             if matched_mood_genres:
                 reasons.append(f"Fits your {mood} mood")
 
-        # High rating
-        if movie['vote_average'] >= 7.5:
+        # High rating (NULL-safe: unrated rows just skip the reason)
+        if (movie['vote_average'] or 0) >= 7.5:
             reasons.append(f"Highly rated ({movie['vote_average']}/10)")
 
         # Popular
-        if movie['popularity'] > 100:
+        if (movie['popularity'] or 0) > 100:
             reasons.append("Very popular")
 
         return " | ".join(reasons) if reasons else "Recommended based on overall quality"
 
-    def get_fallback_recommendations(self, top_n: int = 5) -> List[Dict]:
+    def get_fallback_recommendations(self, db: Session, top_n: int = 5) -> List[Dict]:
         """
         Get fallback recommendations when no preferences match
         Returns highly-rated popular movies
         """
-        print("[*] Using fallback recommendations (popular + highly rated)")
-
-        all_movies = get_all_movies(self.db, limit=100)
-
-        movies_data = []
-        for movie in all_movies:
-            # Only include well-rated movies with enough votes
-            if movie.vote_average >= 7.0 and movie.vote_count >= 100:
-                movies_data.append({
-                    'id': movie.id,
-                    'tmdb_id': movie.tmdb_id,
-                    'title': movie.title,
-                    'overview': movie.overview,
-                    'genres': movie.genres,
-                    'release_year': movie.release_year,
-                    'decade': movie.decade,
-                    'vote_average': movie.vote_average,
-                    'vote_count': movie.vote_count,
-                    'popularity': movie.popularity,
-                    'poster_path': movie.poster_path,
-                    'backdrop_path': movie.backdrop_path,
-                    'score': 0.0,
-                    'match_reason': 'Popular and highly rated'
-                })
-
-        df = pd.DataFrame(movies_data)
-
-        # Sort by combination of rating and popularity
-        df['combined_score'] = (df['vote_average'] * 0.6) + (df['popularity'] / 100 * 0.4)
-        df = df.sort_values('combined_score', ascending=False)
-
-        return df.head(top_n).to_dict('records')
-
-    def get_similar_movies(self, movie_id: int, top_n: int = 5) -> List[Dict]:
+        logger.debug("Using fallback recommendations (popular + highly rated)")
+
+        all_movies = get_all_movies(db, limit=100)
+
+        # Only include well-rated movies with enough votes
+        candidates = [
+            movie for movie in all_movies
+            if (movie.vote_average or 0) >= 7.0 and (movie.vote_count or 0) >= 100
+        ]
+        if not candidates:
+            return []
+
+        # Rank by combination of rating and popularity
+        ratings = np.array([m.vote_average for m in candidates], dtype=float)
+        pops = np.array([m.popularity or 0 for m in candidates], dtype=float)
+        combined = ratings * 0.6 + pops / 100 * 0.4
+
+        top_n = min(top_n, len(candidates))
+        top_idx = np.argpartition(-combined, top_n - 1)[:top_n]
+        top_idx = top_idx[np.argsort(-combined[top_idx])]
+
+        results = []
+        for i in top_idx:
+            rec = self._movie_dict(candidates[i])
+            rec['score'] = 0.0
+            rec['match_reason'] = 'Popular and highly rated'
+            results.append(rec)
+        return results
+
+    @staticmethod
+    def _build_similar_topk(catalog: Dict):
+        """
+        Batch-score every catalog movie against every other and keep
+        the SIMILAR_TOPK best per row. Same factors and weights as the
+        per-reference path in get_similar_movies, vectorized over the
+        full pairwise matrix so the work runs once per catalog refresh
+        instead of once per request.
+
+        Returns (rows, scores): int32/float arrays of shape
+        (N, SIMILAR_TOPK), score -inf marking excluded slots.
+        """
+        n = len(catalog['movies'])
+        if n < 2:
+            empty = np.empty((n, 0))
+            return empty.astype(np.int32), empty
+
+        genre_matrix = catalog['genre_matrix']
+        decades = catalog['decades']
+        ratings = catalog['ratings']
+        pops = catalog['popularity']
+
+        # Genre cosine (50%): rows are pre-normalized, so the full
+        # pairwise cosine is a single GEMM
+        sim = (genre_matrix @ genre_matrix.T).astype(float) * 5.0
+
+        # Decade proximity (20%): applies only when both sides have a
+        # known decade, mirroring the per-reference guards
+        decade_diff = np.abs(decades[:, None] - decades[None, :])
+        decade_term = np.select(
+            [decade_diff == 0, decade_diff == 10, decade_diff == 20],
+            [2.0, 1.0, 0.5],
+            default=0.0
+        )
+        decade_term[:, decades == 0] = 0.0
+        decade_term[decades == 0, :] = 0.0
+        sim += decade_term
+
+        # Rating similarity (20%)
+        rating_term = np.maximum(
+            0, (10 - np.abs(ratings[:, None] - ratings[None, :])) / 10
+        ) * 2.0
+        rating_term[:, ratings <= 0] = 0.0
+        rating_term[ratings <= 0, :] = 0.0
+        sim += rating_term
+
+        # Popularity proximity (10%)
+        pop_term = np.minimum(pops[:, None], pops[None, :]) / np.maximum(
+            np.maximum(pops[:, None], pops[None, :]), 1e-9
+        )
+        pop_term[:, pops <= 0] = 0.0
+        pop_term[pops <= 0, :] = 0.0
+        sim += pop_term
+        sim = np.round(sim, 2)
+
+        # Exclude self-matches; distant decades simply score 0 on the
+        # decade factor and stay rankable via the other terms
+        np.fill_diagonal(sim, -np.inf)
+
+        k = min(SIMILAR_TOPK, n - 1)
+        part = np.argpartition(-sim, k - 1, axis=1)[:, :k]
+        part_scores = np.take_along_axis(sim, part, axis=1)
+        order = np.argsort(-part_scores, axis=1)
+        rows = np.take_along_axis(part, order, axis=1).astype(np.int32)
+        scores = np.take_along_axis(part_scores, order, axis=1)
+        return rows, scores
+
+    def get_similar_movies(self, db: Session, movie_id: int, top_n: int = 5) -> List[Dict]:
         """
         Find movies similar to a given movie
         Based on genre overlap, decade, and rating similarity
@@ -302,87 +491,99 @@ class RecommendationEngine:
             List of similar movies with similarity scores
         """
         # Get the reference movie
-        reference_movie = self.db.query(Movie).filter(Movie.id == movie_id).first()
+        reference_movie = db.get(Movie, movie_id)
 
         if not reference_movie:
             return []
 
-        print(f"[*] Finding movies similar to: {reference_movie.title}")
-
-        # Get all other movies
-        all_movies = self.db.query(Movie).filter(Movie.id != movie_id).all()
+        logger.debug("Finding movies similar to: %s", reference_movie.title)
 
-        similar_movies = []
+        catalog = self._get_catalog(db)
+        movies = catalog['movies']
+        if not movies:
+            return []
 
-        for movie in all_movies:
-            similarity_score = self._calculate_similarity(reference_movie, movie)
-
-            similar_movies.append({
-                'id': movie.id,
-                'tmdb_id': movie.tmdb_id,
-                'title': movie.title,
-                'overview': movie.overview,
-                'genres': movie.genres,
-                'release_year': movie.release_year,
-                'decade': movie.decade,
-                'vote_average': movie.vote_average,
-                'vote_count': movie.vote_count,
-                'popularity': movie.popularity,
-                'poster_path': movie.poster_path,
-                'backdrop_path': movie.backdrop_path,
-                'similarity_score': similarity_score,
-                'match_reason': self._get_similarity_reason(reference_movie, movie)
-            })
-
-        # Sort by similarity score
-        similar_movies.sort(key=lambda x: x['similarity_score'], reverse=True)
-
-        return similar_movies[:top_n]
-
-    def _calculate_similarity(self, movie1: Movie, movie2: Movie) -> float:
-        """
-        Calculate similarity score between two movies (0-10 scale)
+        # Hot path: the reference is in the cached slice and its
+        # neighbors were precomputed at catalog refresh, so serving is
+        # an array slice plus payload building for top_n rows
+        ref_row = catalog['id_to_row'].get(movie_id)
+        if ref_row is not None and top_n <= catalog['similar_rows'].shape[1]:
+            similar_movies = []
+            for row, score in zip(
+                catalog['similar_rows'][ref_row].tolist(),
+                catalog['similar_scores'][ref_row].tolist()
+            ):
+                if len(similar_movies) >= top_n:
+                    break
+                if score == float('-inf'):
+                    continue
+                movie = movies[row]
+                rec = self._movie_dict(movie)
+                rec['similarity_score'] = score
+                rec['match_reason'] = self._get_similarity_reason(reference_movie, movie)
+                similar_movies.append(rec)
+            return similar_movies
+
+        # Fallback for references outside the cached slice (or an
+        # oversized top_n): score on the fly; the genre factor is one
+        # matrix-vector product against the pre-normalized matrix
+        vocab = catalog['genre_vocab']
+        probe = np.zeros(catalog['genre_matrix'].shape[1], dtype=np.float32)
+        for g in reference_movie.genres or []:
+            if g in vocab:
+                probe[vocab[g]] = 1.0
+        probe_norm = np.linalg.norm(probe)
+        if probe_norm > 0:
+            probe /= probe_norm
+        scores = (catalog['genre_matrix'] @ probe).astype(float) * 5.0
+
+        # Decade proximity (20% weight): same 2.0, adjacent 1.0,
+        # two decades apart 0.5
+        decades = catalog['decades']
+        if reference_movie.decade:
+            decade_diff = np.abs(decades - reference_movie.decade)
+            scores = scores + np.select(
+                [decades == 0, decade_diff == 0, decade_diff == 10, decade_diff == 20],
+                [0.0, 2.0, 1.0, 0.5],
+                default=0.0
+            )
 
-        Factors:
-        - Genre overlap: 50%
-        - Decade proximity: 20%
-        - Rating similarity: 20%
-        - Popularity proximity: 10%
-        """
-        score = 0.0
+        # Rating similarity (20% weight)
+        ratings = catalog['ratings']
+        if reference_movie.vote_average:
+            rating_sim = np.maximum(0, (10 - np.abs(ratings - reference_movie.vote_average)) / 10) * 2.0
+            scores = scores + np.where(ratings > 0, rating_sim, 0.0)
+
+        # Popularity proximity (10% weight)
+        pops = catalog['popularity']
+        if reference_movie.popularity:
+            pop_ratio = np.minimum(pops, reference_movie.popularity) / np.maximum(
+                np.maximum(pops, reference_movie.popularity), 1e-9
+            )
+            scores = scores + np.where(pops > 0, pop_ratio, 0.0)
+        scores = np.round(scores, 2)
 
-        genres1 = set(movie1.genres) if movie1.genres else set()
-        genres2 = set(movie2.genres) if movie2.genres else set()
+        # Exclude only the reference itself; distant decades score 0 on
+        # the decade factor but still compete on the other terms
+        if ref_row is not None:
+            scores[ref_row] = -np.inf
 
-        # 1. Genre overlap (50% weight) - Jaccard similarity
-        if genres1 and genres2:
-            intersection = len(genres1.intersection(genres2))
-            union = len(genres1.union(genres2))
-            genre_similarity = (intersection / union) * 5.0
-            score += genre_similarity
-
-        # 2. Decade proximity (20% weight)
-        if movie1.decade and movie2.decade:
-            decade_diff = abs(movie1.decade - movie2.decade)
-            if decade_diff == 0:
-                score += 2.0  # Same decade
-            elif decade_diff == 10:
-                score += 1.0  # Adjacent decade
-            elif decade_diff == 20:
-                score += 0.5  # Two decades apart
-
-        # 3. Rating similarity (20% weight)
-        if movie1.vote_average and movie2.vote_average:
-            rating_diff = abs(movie1.vote_average - movie2.vote_average)
-            rating_similarity = max(0, (10 - rating_diff) / 10) * 2.0
-            score += rating_similarity
+        # Top-N via argpartition (O(N)) then order just those N
+        top_n = min(top_n, len(movies))
+        top_idx = np.argpartition(-scores, top_n - 1)[:top_n]
+        top_idx = top_idx[np.argsort(-scores[top_idx])]
 
-        # 4. Popularity proximity (10% weight)
-        if movie1.popularity and movie2.popularity:
-            pop_ratio = min(movie1.popularity, movie2.popularity) / max(movie1.popularity, movie2.popularity)
-            score += pop_ratio * 1.0
+        similar_movies = []
+        for i in top_idx:
+            if not np.isfinite(scores[i]):
+                continue
+            movie = movies[i]
+            rec = self._movie_dict(movie)
+            rec['similarity_score'] = float(scores[i])
+            rec['match_reason'] = self._get_similarity_reason(reference_movie, movie)
+            similar_movies.append(rec)
 
-        return round(score, 2)
+        return similar_movies
 
     def _get_similarity_reason(self, movie1: Movie, movie2: Movie) -> str:
         """
@@ -410,36 +611,33 @@ class RecommendationEngine:
 
         return " | ".join(reasons) if reasons else "General similarity"
 
-    def get_trending_recommendations(self, top_n: int = 10) -> List[Dict]:
+    def get_trending_recommendations(self, db: Session, top_n: int = 10) -> List[Dict]:
         """
         Get currently trending/popular movies
         Based on popularity and recent ratings
         """
-        print("[*] Getting trending recommendations")
+        logger.debug("Getting trending recommendations")
 
         # Get movies sorted by popularity
-        trending_movies = self.db.query(Movie).filter(
-            Movie.vote_count >= 100  # Must have significant votes
-        ).order_by(
-            Movie.popularity.desc()
-        ).limit(top_n).all()
+        trending_movies = db.scalars(
+            select(Movie).options(
+                load_only(*MOVIE_FIELDS)
+            ).where(
+                Movie.vote_count >= 100  # Must have significant votes
+            ).order_by(
+                Movie.popularity.desc().nullslast()
+            ).limit(top_n)
+        ).all()
 
         result = []
         for movie in trending_movies:
-            result.append({
-                'id': movie.id,
-                'tmdb_id': movie.tmdb_id,
-                'title': movie.title,
-                'overview': movie.overview,
-                'genres': movie.genres,
-                'release_year': movie.release_year,
-                'decade': movie.decade,
-                'vote_average': movie.vote_average,
-                'vote_count': movie.vote_count,
-                'popularity': movie.popularity,
-                'poster_path': movie.poster_path,
-                'backdrop_path': movie.backdrop_path,
-                'match_reason': 'Currently trending'
-            })
+            rec = self._movie_dict(movie)
+            rec['match_reason'] = 'Currently trending'
+            result.append(rec)
 
         return result
+
+
+# Shared instance: the engine carries no per-request state, so routes
+# reuse this instead of constructing one per call
+engine = RecommendationEngine()
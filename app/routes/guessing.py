@@ -2,6 +2,7 @@
 API routes for character guessing game
 """
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.database.db import get_db
@@ -12,11 +13,14 @@ from app.schemas import (
 )
 from app.models.guessing_game import CharacterGuessingGame
 
+# Handlers here are deliberately plain `def`: FastAPI runs them on its
+# threadpool, keeping the blocking SQLAlchemy calls off the event loop.
+# Don't mark one `async def` unless every call inside it is awaitable.
 router = APIRouter(prefix="/api/game", tags=["guessing-game"])
 
 
 @router.post("/start", response_model=GameStartResponse)
-async def start_game(db: Session = Depends(get_db)):
+def start_game(db: Session = Depends(get_db)):
     """
     Start a new guessing game session
 
@@ -33,7 +37,7 @@ async def start_game(db: Session = Depends(get_db)):
 
 
 @router.post("/answer", response_model=GameAnswerResponse)
-async def answer_question(
+def answer_question(
     request: GameAnswerRequest,
     db: Session = Depends(get_db)
 ):
@@ -43,7 +47,8 @@ async def answer_question(
     - **session_id**: Current game session ID
     - **question_number**: Which question is being answered
     - **answer**: User's answer
-    - **candidate_ids**: Current list of possible character IDs
+    - **candidate_ids**: Optional; only needed to restore a session
+      after a server restart (state is tracked server-side)
 
     Returns either the next question or final guess
     """
@@ -64,26 +69,32 @@ async def answer_question(
 
 
 @router.get("/characters")
-async def list_characters(db: Session = Depends(get_db)):
+def list_characters(db: Session = Depends(get_db)):
     """
     List all available characters in the game
     """
     from app.database.models import Character
 
     try:
-        characters = db.query(Character).order_by(
+        # Project just the six columns the response uses — skips
+        # hydrating full ORM objects with their JSON fields
+        characters = db.execute(select(
+            Character.id, Character.name, Character.type,
+            Character.source, Character.popularity_score,
+            Character.image_url
+        ).order_by(
             Character.popularity_score.desc()
-        ).all()
+        )).all()
 
         result = []
-        for char in characters:
+        for char_id, name, char_type, source, popularity_score, image_url in characters:
             result.append({
-                'id': char.id,
-                'name': char.name,
-                'type': char.type,
-                'source': char.source,
-                'popularity_score': char.popularity_score,
-                'image_url': char.image_url
+                'id': char_id,
+                'name': name,
+                'type': char_type,
+                'source': source,
+                'popularity_score': popularity_score,
+                'image_url': image_url
             })
 
         return {
@@ -1,9 +1,12 @@
 """
 API routes for movie/book recommendations
 """
+import time
+from collections import OrderedDict
+
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Callable, List, Tuple
 
 from app.database.db import get_db
 from app.schemas import (
@@ -11,13 +14,51 @@ from app.schemas import (
     RecommendationResponse,
     SimilarRequest
 )
-from app.models.recommendations import RecommendationEngine
+from app.models.recommendations import engine
 
+# Handlers here are deliberately plain `def`: FastAPI runs them on its
+# threadpool, keeping the blocking SQLAlchemy calls off the event loop.
+# Don't mark one `async def` unless every call inside it is awaitable.
 router = APIRouter(prefix="/api", tags=["recommendations"])
 
+# Cache-aside for the near-static list/trending responses, keyed by
+# the query params. In-process per worker: at one replica this removes
+# the DB hit with zero infrastructure, same pattern as the /health
+# count cache; an external cache tier would slot in here if the app
+# ever scales out.
+RESPONSE_CACHE_TTL = 120  # seconds
+# Bounded LRU: search strings make the key space unbounded, so evict
+# the coldest entries past this size (same scheme as the game's
+# session cache)
+RESPONSE_CACHE_MAX = 1024
+_response_cache: "OrderedDict[Tuple, Tuple[float, dict]]" = OrderedDict()
+
+
+def _cache_get(key: Tuple):
+    hit = _response_cache.get(key)
+    if hit is None or time.monotonic() >= hit[0]:
+        return None
+    _response_cache.move_to_end(key)
+    return hit[1]
+
+
+def _cache_put(key: Tuple, value: dict) -> None:
+    _response_cache[key] = (time.monotonic() + RESPONSE_CACHE_TTL, value)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > RESPONSE_CACHE_MAX:
+        _response_cache.popitem(last=False)
+
+
+def _cached_response(key: Tuple, build: Callable[[], dict]) -> dict:
+    value = _cache_get(key)
+    if value is None:
+        value = build()
+        _cache_put(key, value)
+    return value
+
 
 @router.post("/recommendations", response_model=RecommendationResponse)
-async def get_recommendations(
+def get_recommendations(
     request: RecommendationRequest,
     db: Session = Depends(get_db)
 ):
@@ -32,10 +73,9 @@ async def get_recommendations(
     - **min_rating**: Minimum quality threshold
     """
     try:
-        engine = RecommendationEngine(db)
-
         if request.content_type == 'movie':
             result = engine.recommend_movies(
+                db,
                 genres=request.genres,
                 decade=request.decade,
                 mood=request.mood,
@@ -46,6 +86,7 @@ async def get_recommendations(
         elif request.content_type == 'book':
             # Books use same logic, just different table
             result = engine.recommend_movies(  # Will create recommend_books() method
+                db,
                 genres=request.genres,
                 decade=request.decade,
                 mood=request.mood,
@@ -66,7 +107,7 @@ async def get_recommendations(
 
 
 @router.get("/movies/{movie_id}/similar")
-async def get_similar_movies(
+def get_similar_movies(
     movie_id: int,
     top_n: int = 5,
     db: Session = Depends(get_db)
@@ -75,8 +116,7 @@ async def get_similar_movies(
     Get movies similar to a specific movie
     """
     try:
-        engine = RecommendationEngine(db)
-        similar = engine.get_similar_movies(movie_id, top_n=top_n)
+        similar = engine.get_similar_movies(db, movie_id, top_n=top_n)
 
         return {
             "reference_movie_id": movie_id,
@@ -88,7 +128,7 @@ async def get_similar_movies(
 
 
 @router.get("/trending/movies")
-async def get_trending_movies(
+def get_trending_movies(
     top_n: int = 10,
     db: Session = Depends(get_db)
 ):
@@ -96,33 +136,49 @@ async def get_trending_movies(
     Get currently trending movies
     """
     try:
-        engine = RecommendationEngine(db)
-        trending = engine.get_trending_recommendations(top_n=top_n)
-
-        return {
-            "trending": trending
-        }
+        return _cached_response(
+            ('trending', top_n),
+            lambda: {
+                "trending": engine.get_trending_recommendations(db, top_n=top_n)
+            }
+        )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/movies")
-async def list_movies(
+def list_movies(
     limit: int = 20,
     genre: str = None,
+    search: str = None,
+    after_popularity: float = None,
+    after_id: int = None,
     db: Session = Depends(get_db)
 ):
     """
-    List all movies (optionally filtered by genre)
+    List all movies (optionally filtered by genre or title search).
+    Pass the last item's popularity and id as after_popularity /
+    after_id to fetch the next page (keyset pagination; the id
+    tie-break keeps equal-popularity rows from being skipped).
     """
-    from app.database.crud import get_all_movies, get_movies_by_genre
+    from app.database.crud import get_all_movies, get_movies_by_genre, search_movies
 
     try:
-        if genre:
+        cached = _cache_get(('movies', limit, genre, search, after_popularity, after_id))
+        if cached is not None:
+            return cached
+
+        if search:
+            movies = search_movies(db, search, limit=limit)
+        elif genre:
             movies = get_movies_by_genre(db, genre, limit=limit)
         else:
-            movies = get_all_movies(db, limit=limit)
+            movies = get_all_movies(
+                db, limit=limit,
+                after_popularity=after_popularity,
+                after_id=after_id
+            )
 
         result = []
         for movie in movies:
@@ -138,31 +194,48 @@ async def list_movies(
                 'poster_path': movie.poster_path
             })
 
-        return {
+        response = {
             'movies': result,
             'count': len(result)
         }
+        _cache_put(('movies', limit, genre, search, after_popularity, after_id), response)
+        return response
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/books")
-async def list_books(
+def list_books(
     limit: int = 20,
     category: str = None,
+    after_rating: float = None,
+    after_ratings_count: int = None,
+    after_id: int = None,
     db: Session = Depends(get_db)
 ):
     """
-    List all books (optionally filtered by category)
+    List all books (optionally filtered by category). Pass the last
+    item's average_rating, ratings_count and id to fetch the next page
+    (keyset pagination over the composite sort key; the id tie-break
+    keeps rows with equal rating pairs from being skipped).
     """
     from app.database.crud import get_all_books, get_books_by_category
 
     try:
+        cached = _cache_get(('books', limit, category, after_rating, after_ratings_count, after_id))
+        if cached is not None:
+            return cached
+
         if category:
             books = get_books_by_category(db, category, limit=limit)
         else:
-            books = get_all_books(db, limit=limit)
+            books = get_all_books(
+                db, limit=limit,
+                after_rating=after_rating,
+                after_ratings_count=after_ratings_count,
+                after_id=after_id
+            )
 
         result = []
         for book in books:
@@ -177,10 +250,12 @@ async def list_books(
                 'thumbnail': book.thumbnail
             })
 
-        return {
+        response = {
             'books': result,
             'count': len(result)
         }
+        _cache_put(('books', limit, category, after_rating, after_ratings_count, after_id), response)
+        return response
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,7 +1,7 @@
 """
 Pydantic schemas for API request/response validation
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 
 
@@ -19,8 +19,8 @@ class RecommendationRequest(BaseModel):
     min_rating: Optional[float] = Field(None, ge=0, le=10, description="Minimum rating (0-10)")
     top_n: int = Field(5, ge=1, le=20, description="Number of recommendations")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "content_type": "movie",
                 "genres": ["Action", "Sci-Fi"],
@@ -29,25 +29,32 @@ class RecommendationRequest(BaseModel):
                 "top_n": 5
             }
         }
+    )
 
 
 class RecommendationItem(BaseModel):
     """Single recommendation item"""
     id: int
+    tmdb_id: Optional[int] = None
     title: str
-    overview: Optional[str]
-    genres: List[str]
-    release_year: Optional[int]
-    vote_average: Optional[float]
-    popularity: Optional[float]
-    poster_path: Optional[str]
+    overview: Optional[str] = None
+    genres: Optional[List[str]] = None
+    release_year: Optional[int] = None
+    decade: Optional[int] = None
+    vote_average: Optional[float] = None
+    vote_count: Optional[int] = None
+    popularity: Optional[float] = None
+    poster_path: Optional[str] = None
+    backdrop_path: Optional[str] = None
     score: float
     match_reason: str
 
 
 class RecommendationResponse(BaseModel):
     """Response model for recommendations"""
-    recommendations: List[Dict[str, Any]]
+    # Concrete item type (not Dict[str, Any]) so FastAPI serializes
+    # through pydantic-core's precompiled serializer
+    recommendations: List[RecommendationItem]
     match_quality: str
     total_candidates: int
 
@@ -76,17 +83,19 @@ class GameAnswerRequest(BaseModel):
     session_id: str
     question_number: int
     answer: str
-    candidate_ids: List[int]
+    # Optional: game state lives server-side, keyed by session_id.
+    # Accepted only to restore older clients after a server restart.
+    candidate_ids: Optional[List[int]] = None
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "session_id": "550e8400-e29b-41d4-a716-446655440000",
                 "question_number": 1,
-                "answer": "anime",
-                "candidate_ids": [1, 2, 3, 4, 5]
+                "answer": "anime"
             }
         }
+    )
 
 
 class GuessItem(BaseModel):
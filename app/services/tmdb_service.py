@@ -1,16 +1,46 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Optional
-from datetime import datetime
-import time
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Final, List, Dict, Mapping, Optional
+
+# TMDB genre id -> name, hoisted to module scope so row processing
+# does plain dict lookups instead of rebuilding the map per call.
+# Read-only proxy: the map is shared across modules (fetch_actors
+# imports it), so no caller can mutate it under another
+_GENRE_MAP: Final[Mapping[int, str]] = MappingProxyType({
+    28: 'Action', 12: 'Adventure', 16: 'Animation', 35: 'Comedy', 80: 'Crime',
+    99: 'Documentary', 18: 'Drama', 10751: 'Family', 14: 'Fantasy', 36: 'History',
+    27: 'Horror', 10402: 'Music', 9648: 'Mystery', 10749: 'Romance',
+    878: 'Science Fiction', 10770: 'TV Movie', 53: 'Thriller', 10752: 'War', 37: 'Western'
+})
 
 class TMDBService:
     BASE_URL = "https://api.themoviedb.org/3"
     IMAGE_BASE_URL = "https://image.tmdb.org/t/p/w500"
+    # Concurrent in-flight requests; doubles as the rate limiter
+    # (TMDB allows ~40 requests per 10 seconds)
+    MAX_WORKERS = 5
 
     def __init__(self, api_key: str):
         self.api_key = api_key
+        # Pooled keep-alive connections sized for the worker fanout, so
+        # concurrent page fetches reuse warm TLS connections instead of
+        # handshaking per request; transient failures and 429s retry
+        # with backoff instead of surfacing as lost pages
         self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        ))
 
     def _make_request(self, endpoint: str, params: Dict = None) -> Dict:
         if params is None: params = {}
@@ -25,55 +55,106 @@ class TMDBService:
             return None
 
     def fetch_popular_movies(self, pages: int = 5) -> pd.DataFrame:
+        # Pages are independent and latency-bound, so fan them out over
+        # a small worker pool instead of sleeping between serial GETs;
+        # wall time drops to roughly one round-trip per MAX_WORKERS
+        # pages (the underlying urllib3 pool is thread-safe)
         all_movies = []
-        for page in range(1, pages + 1):
-            data = self._make_request('/movie/popular', {'page': page})
-            if data and 'results' in data:
-                all_movies.extend(data['results'])
-            time.sleep(0.25)
+        seen_ids = set()
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+            pages_data = pool.map(
+                lambda page: self._make_request('/movie/popular', {'page': page}),
+                range(1, pages + 1)
+            )
+            for data in pages_data:
+                if data and 'results' in data:
+                    for movie in data['results']:
+                        if movie['id'] not in seen_ids:
+                            seen_ids.add(movie['id'])
+                            all_movies.append(movie)
         return self._process_movie_data(pd.DataFrame(all_movies))
 
     def fetch_1k_movies(self):
-        all_movies = []
+        # 80 independent (year, page) requests: overlap them on the
+        # worker pool instead of 80 serial RTTs plus a 0.2s sleep each;
+        # wall time collapses to roughly 80 / MAX_WORKERS round-trips
         years = [2025, 2024, 2023, 2022, 2021, 2020, 2019, 2018]
-        for year in years:
-            for page in range(1, 11):
-                data = self._make_request('/discover/movie', {
-                    'primary_release_year': year,
-                    'sort_by': 'popularity.desc',
-                    'page': page,
-                    'vote_count.gte': 100
-                })
+        requests_params = [
+            {
+                'primary_release_year': year,
+                'sort_by': 'popularity.desc',
+                'page': page,
+                'vote_count.gte': 100
+            }
+            for year in years for page in range(1, 11)
+        ]
+        # Dedupe on the scalar id while collecting raw dicts: an O(1)
+        # set check per movie, so rows that shifted between pages never
+        # reach the DataFrame
+        all_movies = []
+        seen_ids = set()
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+            pages_data = pool.map(
+                lambda params: self._make_request('/discover/movie', params),
+                requests_params
+            )
+            for data in pages_data:
                 if data and 'results' in data:
-                    all_movies.extend(data['results'])
-                time.sleep(0.2)
+                    for movie in data['results']:
+                        if movie['id'] not in seen_ids:
+                            seen_ids.add(movie['id'])
+                            all_movies.append(movie)
         return self._process_movie_data(pd.DataFrame(all_movies))
 
     def _process_movie_data(self, df: pd.DataFrame) -> pd.DataFrame:
         if df.empty: return df
         df['release_date'] = pd.to_datetime(df['release_date'], errors='coerce')
-        df['release_year'] = df['release_date'].dt.year
-        df['decade'] = (df['release_year'] // 10) * 10
-        df['genre_names'] = df['genre_ids'].apply(self._get_genre_names)
-        df['poster_url'] = df['poster_path'].apply(lambda x: f"{self.IMAGE_BASE_URL}{x}" if pd.notna(x) else None)
+        # Nullable Int16 keeps missing dates as <NA> instead of letting
+        # dt.year promote the column to float64, and the decade divide
+        # stays pure integer arithmetic
+        df['release_year'] = df['release_date'].dt.year.astype('Int16')
+        df['decade'] = (df['release_year'] // 10 * 10).astype('Int16')
+        # List comprehension over the raw ndarray: per-row work is a
+        # couple of dict lookups, with no Series.apply dispatch per row
+        # (the Unknown f-string is only built on an actual miss, not
+        # evaluated as an eager .get() default per id)
+        df['genre_names'] = [
+            [
+                _GENRE_MAP[gid] if gid in _GENRE_MAP else f'Unknown({gid})'
+                for gid in ids
+            ]
+            if isinstance(ids, list) else []
+            for ids in df['genre_ids'].to_numpy()
+        ]
+        # Vectorized string concat instead of a per-row format lambda
+        df['poster_url'] = np.where(
+            df['poster_path'].notna(),
+            self.IMAGE_BASE_URL + df['poster_path'].astype(str),
+            None
+        )
         df = df.rename(columns={
             'id': 'tmdb_id', 'vote_average': 'vote_average',
             'vote_count': 'vote_count', 'popularity': 'popularity'
         })
+        # genre_ids has served its purpose once genre_names exists;
+        # dropping it here keeps a dead object column out of the
+        # dedup/sort passes and the bulk-save payload
         columns_to_keep = [
-            'tmdb_id', 'title', 'overview', 'genre_ids', 'genre_names',
+            'tmdb_id', 'title', 'overview', 'genre_names',
             'release_date', 'release_year', 'decade', 'vote_average',
             'vote_count', 'popularity', 'poster_url'
         ]
         df = df[[col for col in columns_to_keep if col in df.columns]]
-        return df.drop_duplicates(subset=['tmdb_id']).sort_values('popularity', ascending=False)
+        # Sort first, then dedupe keep='first': the hash pass runs on
+        # the already-ordered frame, so the surviving row per tmdb_id
+        # is the most popular one and no re-sort of the result is needed
+        return df.sort_values('popularity', ascending=False).drop_duplicates(
+            subset=['tmdb_id'], keep='first'
+        )
 
     def _get_genre_names(self, genre_ids: List[int]) -> List[str]:
-        genre_map = {
-            28: 'Action', 12: 'Adventure', 16: 'Animation', 35: 'Comedy', 80: 'Crime',
-            99: 'Documentary', 18: 'Drama', 10751: 'Family', 14: 'Fantasy', 36: 'History',
-            27: 'Horror', 10402: 'Music', 9648: 'Mystery', 10749: 'Romance',
-            878: 'Science Fiction', 10770: 'TV Movie', 53: 'Thriller', 10752: 'War', 37: 'Western'
-        }
         if not isinstance(genre_ids, list): return []
-        return [genre_map.get(gid, f'Unknown({gid})') for gid in genre_ids]
+        return [
+            _GENRE_MAP[gid] if gid in _GENRE_MAP else f'Unknown({gid})'
+            for gid in genre_ids
+        ]
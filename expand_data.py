@@ -7,6 +7,7 @@ from app.services.books_service import GoogleBooksService
 from app.database.db import SessionLocal
 from app.database.crud import save_movies_bulk, save_books_bulk
 from app.database.models import Character
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 load_dotenv()
 
@@ -28,16 +29,27 @@ def expand_all_to_1k():
     print("Loading Characters...")
     with open('data/anime_characters_raw.json', 'r', encoding='utf-8') as f:
         chars = json.load(f)
-    for c in chars:
-        if not db.query(Character).filter(Character.name == c['name']).first():
-            db.add(Character(
-                name=c['name'],
-                type="Anime",
-                popularity_score=c.get('favorites', 0),
-                image_url=c.get('image_url'),
-                traits=["Anime"],
-                source="Jikan API"
-            ))
+    # Uniqueness is enforced by the characters.name constraint, so one
+    # INSERT .. ON CONFLICT DO NOTHING round-trip covers the whole
+    # file; Postgres skips names already present (or repeated within
+    # the batch) without any existence query or race window
+    rows = [
+        {
+            'name': c['name'],
+            'type': "Anime",
+            'popularity_score': c.get('favorites', 0),
+            'image_url': c.get('image_url'),
+            'traits': ["Anime"],
+            'source': "Jikan API"
+        }
+        for c in chars
+    ]
+    if rows:
+        db.execute(
+            pg_insert(Character.__table__)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=['name'])
+        )
     db.commit()
     db.close()
 
@@ -1,10 +1,11 @@
 """
 Fetch popular actors from TMDB API
 """
+import heapq
 import os
 from dotenv import load_dotenv
-from app.services.tmdb_service import TMDBService
-import json
+from app.services.tmdb_service import TMDBService, _GENRE_MAP
+import orjson
 
 load_dotenv()
 
@@ -41,15 +42,16 @@ def fetch_popular_actors(pages: int = 3):
     processed_actors = []
 
     for actor in all_actors:
-        # Get known_for movies to determine genres
+        # Get known_for movies to determine genres (top 3 works).
+        # Direct lookups in the shared genre map: no method call or
+        # single-element list allocated per genre id
         known_for = actor.get('known_for', [])
-        genres = set()
-
-        for work in known_for[:3]:  # Top 3 works
-            if 'genre_ids' in work:
-                for genre_id in work['genre_ids']:
-                    genre_name = tmdb._get_genre_names([genre_id])
-                    genres.update(genre_name)
+        genres = {
+            _GENRE_MAP[genre_id] if genre_id in _GENRE_MAP
+            else f'Unknown({genre_id})'
+            for work in known_for[:3]
+            for genre_id in work.get('genre_ids', [])
+        }
 
         processed_actors.append({
             'tmdb_id': actor.get('id'),
@@ -61,19 +63,22 @@ def fetch_popular_actors(pages: int = 3):
             'genres': list(genres)
         })
 
-    # Sort by popularity
-    processed_actors.sort(key=lambda x: x['popularity'], reverse=True)
+    # Top 50 by popularity: nlargest is O(N log 50) and skips sorting
+    # the actors that never make the cut
+    top_actors = heapq.nlargest(
+        50, processed_actors, key=lambda a: a['popularity'] or 0.0
+    )
 
-    # Save to JSON
+    # Save to JSON (orjson: C serializer, UTF-8 bytes out)
     output_file = 'data/actors_raw.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(processed_actors[:50], f, indent=2, ensure_ascii=False)  # Top 50
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(top_actors, option=orjson.OPT_INDENT_2))
 
     print(f"\n[SUCCESS] Saved top 50 actors to {output_file}")
 
     # Show preview
     print(f"\n[PREVIEW] Top 10 actors:")
-    for i, actor in enumerate(processed_actors[:10], 1):
+    for i, actor in enumerate(top_actors[:10], 1):
         print(f"{i}. {actor['name']} (Popularity: {actor['popularity']:.0f})")
         print(f"   Known for: {', '.join(actor['known_for'][:2])}")
         print(f"   Genres: {', '.join(actor['genres'][:3])}")
@@ -1,6 +1,7 @@
 import json
 from app.database.db import SessionLocal
 from app.database.models import Character
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from datetime import datetime
 
 
@@ -16,46 +17,54 @@ def seed_characters():
     db = SessionLocal()
 
     try:
-        added = 0
-        updated = 0
-
-        for char_data in characters:
-            # Check if character already exists
-            existing = db.query(Character).filter(
-                Character.name == char_data['name']
-            ).first()
-
-            if existing:
-                # Update existing
-                existing.type = char_data['type']
-                existing.alignment = char_data.get('alignment')
-                existing.traits = char_data.get('traits', [])
-                existing.genres = char_data.get('genres', [])
-                existing.popularity_score = char_data.get('popularity_score')
-                existing.source = char_data.get('source')
-                existing.additional_info = {
+        # One upsert covers the whole file: the name constraint lets
+        # Postgres decide insert-vs-update per row, replacing the
+        # existence query plus the per-row UPDATE flood with a single
+        # statement (same pattern as the movie/book bulk saves)
+        # Last occurrence wins on duplicate names: ON CONFLICT DO
+        # UPDATE refuses to touch the same row twice in one statement,
+        # and hand-edited seed files aren't dedup-guaranteed
+        rows_by_name = {
+            char_data['name']: {
+                'name': char_data['name'],
+                'type': char_data['type'],
+                'alignment': char_data.get('alignment'),
+                'traits': char_data.get('traits', []),
+                'genres': char_data.get('genres', []),
+                'popularity_score': char_data.get('popularity_score'),
+                'source': char_data.get('source'),
+                'additional_info': {
                     'gender': char_data.get('gender')
                 }
-                updated += 1
-            else:
-                # Create new
-                character = Character(
-                    name=char_data['name'],
-                    type=char_data['type'],
-                    alignment=char_data.get('alignment'),
-                    traits=char_data.get('traits', []),
-                    genres=char_data.get('genres', []),
-                    popularity_score=char_data.get('popularity_score'),
-                    source=char_data.get('source'),
-                    additional_info={
-                        'gender': char_data.get('gender')
-                    }
-                )
-                db.add(character)
-                added += 1
+            }
+            for char_data in characters
+        }
+        rows = list(rows_by_name.values())
+
+        if not rows:
+            print("[SUCCESS] Added: 0, Updated: 0")
+            return
 
+        # Count-only query so the summary still separates added from
+        # updated; the write path no longer depends on it
+        existing = db.query(Character.name).filter(
+            Character.name.in_([row['name'] for row in rows])
+        ).count()
+
+        stmt = pg_insert(Character.__table__).values(rows)
+        update_cols = {
+            key: stmt.excluded[key]
+            for key in rows[0] if key != 'name'
+        }
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=['name'],
+            set_=update_cols
+        ))
         db.commit()
 
+        added = len(rows) - existing
+        updated = existing
+
         print(f"[SUCCESS] Added: {added}, Updated: {updated}")
         print(f"[SUCCESS] Total characters in database: {added + updated}")
 
@@ -67,27 +67,35 @@ def seed_characters():
 
     db = SessionLocal()
     try:
+        # One IN (...) query fetches every existing name up front, so
+        # the loop does set lookups instead of a SELECT per character
+        existing_names = {
+            row[0] for row in db.query(Character.name).filter(
+                Character.name.in_([c['name'] for c in characters])
+            ).all()
+        }
+
+        # Collect new rows and insert them in one executemany rather
+        # than one ORM flush per character
+        to_insert = []
         for char_data in characters:
-            existing = db.query(Character).filter(
-                Character.name == char_data['name']
-            ).first()
-
-            if not existing:
-                character = Character(
-                    name=char_data['name'],
-                    type=char_data['type'],
-                    alignment=char_data.get('alignment'),
-                    traits=char_data.get('traits', []),
-                    genres=char_data.get('genres', []),
-                    popularity_score=char_data.get('popularity_score'),
-                    source=char_data.get('source'),
-                    image_url=char_data.get('image_url'),
-                    additional_info={
+            if char_data['name'] not in existing_names:
+                to_insert.append({
+                    'name': char_data['name'],
+                    'type': char_data['type'],
+                    'alignment': char_data.get('alignment'),
+                    'traits': char_data.get('traits', []),
+                    'genres': char_data.get('genres', []),
+                    'popularity_score': char_data.get('popularity_score'),
+                    'source': char_data.get('source'),
+                    'image_url': char_data.get('image_url'),
+                    'additional_info': {
                         'gender': char_data.get('gender')
                     }
-                )
-                db.add(character)
+                })
 
+        if to_insert:
+            db.bulk_insert_mappings(Character, to_insert)
         db.commit()
         count = db.query(Character).count()
         print(f"[SUCCESS] Seeded {count} characters")
@@ -1,22 +1,44 @@
 """
 Interactive tool to tag characters with game attributes
 """
-import json
+import orjson
 import os
 
+# Built once at import; every banner print reuses the same string
+BANNER = "=" * 60
+
+# Fixed menus, built once at import instead of per tagged character
+_TRAIT_OPTIONS = (
+    'funny', 'serious', 'determined', 'intelligent',
+    'mysterious', 'strong', 'charismatic', 'witty',
+    'skilled', 'intense', 'pure_hearted', 'loyal'
+)
+_TRAIT_MENU = "\n".join(
+    f"{i}. {trait}" for i, trait in enumerate(_TRAIT_OPTIONS, 1)
+)
+_ALIGN_MAP = {'1': 'hero', '2': 'villain', '3': 'anti-hero'}
+
+# Canonical catalog and its append-only sidecar: tagging sessions
+# append one JSONL record per accepted character (O(new) writes) and
+# compact() folds the sidecar back into the canonical file out-of-band
+OUTPUT_FILE = 'data/characters_tagged.json'
+SIDECAR_FILE = 'data/characters_tagged.jsonl'
+
 
 def load_raw_data():
     """Load raw actor and anime character data"""
     actors = []
     anime_chars = []
 
+    # orjson parses the raw dumps in C; one full read per file keeps
+    # the decode to a single pass over one buffer
     if os.path.exists('data/actors_raw.json'):
-        with open('data/actors_raw.json', 'r', encoding='utf-8') as f:
-            actors = json.load(f)
+        with open('data/actors_raw.json', 'rb') as f:
+            actors = orjson.loads(f.read())
 
     if os.path.exists('data/anime_characters_raw.json'):
-        with open('data/anime_characters_raw.json', 'r', encoding='utf-8') as f:
-            anime_chars = json.load(f)
+        with open('data/anime_characters_raw.json', 'rb') as f:
+            anime_chars = orjson.loads(f.read())
 
     return actors, anime_chars
 
@@ -25,15 +47,23 @@ def tag_character_interactive(character, char_type):
     """
     Interactively tag a single character
     """
-    print("\n" + "="*60)
+    # Each of these keys is read both here and when building the tagged
+    # dict below; bind them once instead of hashing into the dict twice
+    name = character['name']
+    known_for = character.get('known_for', [])
+    genres = character.get('genres', [])
+    anime = character.get('anime', 'Unknown')
+    profile_path = character.get('profile_path')
+
+    print(f"\n{BANNER}")
     if char_type == 'actor':
-        print(f"TAGGING: {character['name']}")
-        print(f"Known for: {', '.join(character.get('known_for', []))}")
-        print(f"Genres: {', '.join(character.get('genres', []))}")
+        print(f"TAGGING: {name}")
+        print(f"Known for: {', '.join(known_for)}")
+        print(f"Genres: {', '.join(genres)}")
     else:
-        print(f"TAGGING: {character['name']}")
-        print(f"From: {character.get('anime', 'Unknown')}")
-    print("="*60)
+        print(f"TAGGING: {name}")
+        print(f"From: {anime}")
+    print(BANNER)
 
     # Gender
     print("\nGender?")
@@ -44,17 +74,11 @@ def tag_character_interactive(character, char_type):
 
     # Traits (for anime) or actor traits
     print("\nSelect traits (comma-separated numbers):")
-    trait_options = [
-        'funny', 'serious', 'determined', 'intelligent',
-        'mysterious', 'strong', 'charismatic', 'witty',
-        'skilled', 'intense', 'pure_hearted', 'loyal'
-    ]
-    for i, trait in enumerate(trait_options, 1):
-        print(f"{i}. {trait}")
+    print(_TRAIT_MENU)
 
     trait_input = input("Traits: ").strip()
     trait_indices = [int(x.strip()) - 1 for x in trait_input.split(',') if x.strip().isdigit()]
-    traits = [trait_options[i] for i in trait_indices if 0 <= i < len(trait_options)]
+    traits = [_TRAIT_OPTIONS[i] for i in trait_indices if 0 <= i < len(_TRAIT_OPTIONS)]
 
     # Alignment (for anime only)
     alignment = None
@@ -64,7 +88,7 @@ def tag_character_interactive(character, char_type):
         print("2. villain")
         print("3. anti-hero")
         align_choice = input("Choice (1/2/3): ").strip()
-        alignment = {'1': 'hero', '2': 'villain', '3': 'anti-hero'}.get(align_choice, 'hero')
+        alignment = _ALIGN_MAP.get(align_choice, 'hero')
 
     # Popularity score
     if char_type == 'actor':
@@ -83,39 +107,98 @@ def tag_character_interactive(character, char_type):
 
     # Build tagged character
     tagged = {
-        'name': character['name'],
+        'name': name,
         'type': char_type,
         'alignment': alignment,
         'traits': traits,
-        'genres': character.get('genres', [])[:3],  # Max 3 genres
+        'genres': genres[:3],  # Max 3 genres
         'popularity_score': popularity_score,
         'gender': gender
     }
 
     if char_type == 'actor':
-        tagged['source'] = ', '.join(character.get('known_for', [])[:2])
-        tagged['image_url'] = f"https://image.tmdb.org/t/p/w185{character.get('profile_path')}" if character.get('profile_path') else None
+        tagged['source'] = ', '.join(known_for[:2])
+        tagged['image_url'] = f"https://image.tmdb.org/t/p/w185{profile_path}" if profile_path else None
     else:
-        tagged['source'] = character.get('anime', 'Unknown')
+        tagged['source'] = anime
         tagged['image_url'] = character.get('image_url')
 
     return tagged
 
 
+def _append_tagged(tagged):
+    """Append one accepted tag to the JSONL sidecar"""
+    with open(SIDECAR_FILE, 'ab') as f:
+        f.write(orjson.dumps(tagged) + b"\n")
+
+
+def load_tagged_characters():
+    """
+    Canonical characters plus any sidecar entries not yet compacted,
+    deduplicated by name (first occurrence wins)
+    """
+    characters = []
+    seen_names = set()
+
+    if os.path.exists(OUTPUT_FILE):
+        with open(OUTPUT_FILE, 'rb') as f:
+            for char in orjson.loads(f.read()).get('characters', []):
+                if char['name'] not in seen_names:
+                    seen_names.add(char['name'])
+                    characters.append(char)
+
+    if os.path.exists(SIDECAR_FILE):
+        with open(SIDECAR_FILE, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                char = orjson.loads(line)
+                if char['name'] not in seen_names:
+                    seen_names.add(char['name'])
+                    characters.append(char)
+
+    return characters
+
+
+def compact():
+    """
+    Fold the sidecar into characters_tagged.json with IDs reassigned.
+    This is the O(existing + new) path, run once instead of on every
+    tagging session.
+    """
+    characters = load_tagged_characters()
+
+    # Assign IDs
+    for i, char in enumerate(characters, 1):
+        char['id'] = i
+
+    # Save: orjson encodes in C and returns UTF-8 bytes, written in a
+    # single call
+    payload = orjson.dumps({'characters': characters}, option=orjson.OPT_INDENT_2)
+    with open(OUTPUT_FILE, 'wb') as f:
+        f.write(payload)
+
+    if os.path.exists(SIDECAR_FILE):
+        os.remove(SIDECAR_FILE)
+
+    print(f"[SUCCESS] Compacted {len(characters)} characters into {OUTPUT_FILE}")
+
+
 def quick_tag_mode():
     """
     Quick tagging with presets for common characters
     """
     actors, anime_chars = load_raw_data()
 
-    print("\n" + "="*60)
+    print(f"\n{BANNER}")
     print("QUICK TAG MODE - Top 30 Characters")
-    print("="*60)
+    print(BANNER)
     print("\nI'll show you characters. Tag the ones you recognize.")
     print("Type 'skip' to skip a character")
     print("Type 'done' to finish\n")
 
     tagged_characters = []
+    session_names = set()
 
     # Mix actors and anime (top 15 each)
     characters_to_tag = []
@@ -141,45 +224,33 @@ def quick_tag_mode():
         elif action == 'skip' or action == 'n':
             continue
 
-        # Tag this character
+        # Tag this character; the accepted record goes straight to the
+        # sidecar so the session writes O(new) bytes and never rewrites
+        # (or even parses) the existing catalog
         tagged = tag_character_interactive(character, char_type)
-        tagged_characters.append(tagged)
+        if tagged['name'] not in session_names:
+            session_names.add(tagged['name'])
+            tagged_characters.append(tagged)
+            _append_tagged(tagged)
 
         print(f"\n[SUCCESS] Tagged! Total: {len(tagged_characters)}")
 
-    # Save tagged characters
-    output_file = 'data/characters_tagged.json'
-
-    # Load existing if any
-    existing = []
-    if os.path.exists(output_file):
-        with open(output_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            existing = data.get('characters', [])
+    print(f"\n{BANNER}")
+    print(f"[SUCCESS] Appended {len(tagged_characters)} characters to {SIDECAR_FILE}")
+    print(f"Run 'python tag_characters.py compact' to fold them into {OUTPUT_FILE}")
+    print(BANNER)
 
-    # Merge (avoid duplicates)
-    existing_names = {char['name'] for char in existing}
-    for tagged in tagged_characters:
-        if tagged['name'] not in existing_names:
-            existing.append(tagged)
 
-    # Assign IDs
-    for i, char in enumerate(existing, 1):
-        char['id'] = i
-
-    # Save
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump({'characters': existing}, f, indent=2, ensure_ascii=False)
-
-    print("\n" + "="*60)
-    print(f"[SUCCESS] Saved {len(existing)} total characters to {output_file}")
-    print("="*60)
+if __name__ == "__main__":
+    import sys
 
+    if len(sys.argv) > 1 and sys.argv[1] == 'compact':
+        compact()
+        raise SystemExit
 
-if __name__ == "__main__":
-    print("="*60)
+    print(BANNER)
     print("CHARACTER TAGGING TOOL")
-    print("="*60)
+    print(BANNER)
     print("\nThis tool helps you tag characters with game attributes.")
     print("We'll go through the top actors and anime characters.\n")
 
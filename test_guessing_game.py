@@ -1,14 +1,19 @@
+import sys
+
 from app.database.db import SessionLocal
 from app.models.guessing_game import CharacterGuessingGame
 
+# Built once at import; every banner print reuses the same string
+BANNER = "=" * 60
+
 
 def play_game_simulation():
     db = SessionLocal()
     game = CharacterGuessingGame(db)
 
-    print("\n" + "="*60)
+    print(f"\n{BANNER}")
     print("CHARACTER GUESSING GAME - SIMULATION")
-    print("="*60)
+    print(BANNER)
     print("\nLet's pretend you're thinking of: NARUTO UZUMAKI")
     print("The game will ask questions and try to guess...\n")
 
@@ -45,21 +50,23 @@ def play_game_simulation():
         # Get all candidates for first question
         if candidate_ids is None:
             # First question - get all character IDs
-            all_chars = db.query(game.db.query(game.db).count())
             from app.database.models import Character
-            all_characters = db.query(Character).all()
-            candidate_ids = [c.id for c in all_characters]
+            # id-only projection: no full Character rows hydrated just
+            # to read their primary keys. Kept as a set so any local
+            # membership check is O(1); the call site materializes the
+            # list the API shape expects
+            candidate_ids = {row[0] for row in db.query(Character.id).all()}
 
         # Answer the question
         response = game.answer_question(
             session_id=session_id,
             question_number=question_num,
             answer=answer,
-            candidate_ids=candidate_ids
+            candidate_ids=list(candidate_ids)
         )
 
         if response['status'] == 'continue':
-            candidate_ids = response['candidate_ids']
+            candidate_ids = set(response['candidate_ids'])
             print(f"[SYSTEM]: {response['remaining_candidates']} candidates remaining")
             question_num = response['question_number']
         else:
@@ -67,9 +74,9 @@ def play_game_simulation():
             break
 
     # Display final guess
-    print("\n" + "="*60)
+    print(f"\n{BANNER}")
     print("FINAL GUESS")
-    print("="*60 + "\n")
+    print(f"{BANNER}\n")
 
     if response['status'] == 'guess':
         print(f"After {response['total_questions']} questions, I think you're thinking of:\n")
@@ -94,30 +101,47 @@ def test_all_characters():
     from app.database.models import Character
     db = SessionLocal()
 
-    characters = db.query(Character).order_by(Character.type, Character.name).all()
-
-    print("\n" + "="*60)
-    print("ALL CHARACTERS IN DATABASE")
-    print("="*60 + "\n")
-
-    print("ACTORS:")
-    for char in characters:
-        if char.type == 'actor':
-            print(f"  - {char.name} ({char.source})")
-            print(f"    Traits: {', '.join(char.traits)}")
-            print(f"    Genres: {', '.join(char.genres)}")
-            print()
-
-    print("\nANIME CHARACTERS:")
-    for char in characters:
-        if char.type == 'anime':
-            alignment = f" [{char.alignment}]" if char.alignment else ""
-            print(f"  - {char.name}{alignment} ({char.source})")
-            print(f"    Traits: {', '.join(char.traits)}")
-            print(f"    Genres: {', '.join(char.genres)}")
-            print()
-
-    print(f"Total characters: {len(characters)}")
+    # Two filtered queries: the database partitions by type, so each
+    # section walks only its own rows instead of the combined list
+    # being scanned twice with a Python-side type check. Selecting just
+    # the printed columns returns plain row tuples — no Character
+    # instances hydrated for fields the listing never shows
+    actors = db.query(
+        Character.name, Character.source, Character.traits, Character.genres
+    ).filter(
+        Character.type == 'actor'
+    ).order_by(Character.name).all()
+    anime = db.query(
+        Character.name, Character.alignment, Character.source,
+        Character.traits, Character.genres
+    ).filter(
+        Character.type == 'anime'
+    ).order_by(Character.name).all()
+
+    # Build each section in memory and write it once: one stdout
+    # write per section instead of several per character
+    lines = [
+        f"\n{BANNER}",
+        "ALL CHARACTERS IN DATABASE",
+        f"{BANNER}\n",
+        "ACTORS:"
+    ]
+    for char in actors:
+        lines.append(f"  - {char.name} ({char.source})")
+        lines.append(f"    Traits: {', '.join(char.traits)}")
+        lines.append(f"    Genres: {', '.join(char.genres)}")
+        lines.append("")
+
+    lines.append("\nANIME CHARACTERS:")
+    for char in anime:
+        alignment = f" [{char.alignment}]" if char.alignment else ""
+        lines.append(f"  - {char.name}{alignment} ({char.source})")
+        lines.append(f"    Traits: {', '.join(char.traits)}")
+        lines.append(f"    Genres: {', '.join(char.genres)}")
+        lines.append("")
+
+    lines.append(f"Total characters: {len(actors) + len(anime)}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     db.close()
 
@@ -126,9 +150,9 @@ def interactive_game():
     db = SessionLocal()
     game = CharacterGuessingGame(db)
 
-    print("\n" + "="*60)
+    print(f"\n{BANNER}")
     print("CHARACTER GUESSING GAME - INTERACTIVE MODE")
-    print("="*60)
+    print(BANNER)
     print("\nThink of a character (actor or anime character) and I'll try to guess!")
     print("Answer the questions honestly.\n")
 
@@ -138,10 +162,10 @@ def interactive_game():
     response = game.start_game()
     session_id = response['session_id']
 
-    # Get all character IDs for first call
+    # Get all character IDs for first call; a set keeps any local
+    # membership check O(1) between rounds
     from app.database.models import Character
-    all_characters = db.query(Character).all()
-    candidate_ids = [c.id for c in all_characters]
+    candidate_ids = {row[0] for row in db.query(Character.id).all()}
 
     question_num = 1
 
@@ -149,40 +173,22 @@ def interactive_game():
         print(f"\n--- Question {question_num} ---")
         print(response['question'])
 
-        if isinstance(response['options'], list):
-            for i, option in enumerate(response['options'], 1):
-                print(f"  {i}. {option}")
-
-            while True:
-                choice = input("\nYour answer (enter number or text): ").strip()
-                # Try to parse as number
-                try:
-                    choice_num = int(choice)
-                    if 1 <= choice_num <= len(response['options']):
-                        answer = response['options'][choice_num - 1]
-                        break
-                except ValueError:
-                    # Check if text matches an option
-                    if choice in response['options']:
-                        answer = choice
-                        break
-                print("Invalid choice. Try again.")
-        else:
-            # Dictionary options (for ranges)
-            for i, option in enumerate(response['options'].keys(), 1):
-                print(f"  {i}. {option}")
-
-            while True:
-                choice = input("\nYour answer (enter number): ").strip()
-                try:
-                    choice_num = int(choice)
-                    options_list = list(response['options'].keys())
-                    if 1 <= choice_num <= len(options_list):
-                        answer = options_list[choice_num - 1]
-                        break
-                except ValueError:
-                    pass
-                print("Invalid choice. Try again.")
+        # List questions and range questions (dict options) share one
+        # path: number the options, then resolve input with a single
+        # dict probe that accepts either the number or the option text
+        options = list(response['options'])
+        for i, option in enumerate(options, 1):
+            print(f"  {i}. {option}")
+
+        lookup = {str(i): option for i, option in enumerate(options, 1)}
+        lookup.update({str(option).lower(): option for option in options})
+
+        while True:
+            choice = input("\nYour answer (enter number or text): ").strip().lower()
+            answer = lookup.get(choice)
+            if answer is not None:
+                break
+            print("Invalid choice. Try again.")
 
         if response['status'] == 'guess':
             break
@@ -192,20 +198,20 @@ def interactive_game():
             session_id=session_id,
             question_number=question_num,
             answer=answer,
-            candidate_ids=candidate_ids
+            candidate_ids=list(candidate_ids)
         )
 
         if response['status'] == 'continue':
-            candidate_ids = response['candidate_ids']
+            candidate_ids = set(response['candidate_ids'])
             print(f"\n[{response['remaining_candidates']} possible characters remaining]")
             question_num = response['question_number']
         else:
             break
 
     # Final guess
-    print("\n" + "="*60)
+    print(f"\n{BANNER}")
     print("MY GUESS")
-    print("="*60 + "\n")
+    print(f"{BANNER}\n")
 
     print(f"After {response['total_questions']} questions, you're thinking of:\n")
 
@@ -228,8 +234,6 @@ def interactive_game():
 
 
 if __name__ == "__main__":
-    import sys
-
     if len(sys.argv) > 1 and sys.argv[1] == 'play':
         # Interactive mode
         interactive_game()
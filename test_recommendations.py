@@ -2,14 +2,17 @@
 Test the recommendation engine with different scenarios
 """
 from app.database.db import SessionLocal
-from app.models.recommendations import RecommendationEngine
+from app.models.recommendations import engine
+
+# Built once at import; every banner print reuses the same string
+BANNER = "=" * 60
 
 
 def print_recommendations(result: dict, scenario: str):
     """Pretty print recommendations"""
-    print("\n" + "="*60)
+    print(f"\n{BANNER}")
     print(f"SCENARIO: {scenario}")
-    print("="*60)
+    print(BANNER)
     print(f"Match Quality: {result['match_quality'].upper()}")
     print(f"Total Candidates: {result['total_candidates']}")
     print(f"\nTop Recommendations:\n")
@@ -24,10 +27,10 @@ def print_recommendations(result: dict, scenario: str):
 
 def main():
     db = SessionLocal()
-    engine = RecommendationEngine(db)
 
     # Test Scenario 1: Action + Recent
     result1 = engine.recommend_movies(
+        db,
         genres=['Action', 'Thriller'],
         decade='2020s',
         mood='intense',
@@ -37,6 +40,7 @@ def main():
 
     # Test Scenario 2: Comedy + Family Friendly
     result2 = engine.recommend_movies(
+        db,
         genres=['Comedy', 'Family'],
         mood='light-hearted',
         min_rating=7.0,
@@ -46,6 +50,7 @@ def main():
 
     # Test Scenario 3: Sci-Fi from 2010s
     result3 = engine.recommend_movies(
+        db,
         genres=['Science Fiction'],
         decade='2010s',
         setting='futuristic',
@@ -55,6 +60,7 @@ def main():
 
     # Test Scenario 4: Just mood (no specific genre)
     result4 = engine.recommend_movies(
+        db,
         mood='thought-provoking',
         min_rating=7.5,
         top_n=5
@@ -63,6 +69,7 @@ def main():
 
     # Test Scenario 5: Impossible preferences (should use fallback)
     result5 = engine.recommend_movies(
+        db,
         genres=['Documentary', 'Western'],  # Rare combination
         decade='1960s',  # We don't have these
         top_n=5
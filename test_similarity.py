@@ -2,13 +2,15 @@
 Test similarity-based recommendations
 """
 from app.database.db import SessionLocal
-from app.models.recommendations import RecommendationEngine
+from app.models.recommendations import engine
 from app.database.crud import get_all_movies
 
+# Built once at import; every banner print reuses the same string
+BANNER = "=" * 60
+
 
 def main():
     db = SessionLocal()
-    engine = RecommendationEngine(db)
 
     # Get a sample movie to find similar ones
     all_movies = get_all_movies(db, limit=10)
@@ -27,16 +29,16 @@ def main():
     if not test_movie:
         test_movie = all_movies[0]
 
-    print("\n" + "="*60)
+    print(f"\n{BANNER}")
     print("FINDING SIMILAR MOVIES")
-    print("="*60)
+    print(BANNER)
     print(f"\nReference Movie: {test_movie.title} ({test_movie.release_year})")
     print(f"Genres: {', '.join(test_movie.genres)}")
     print(f"Rating: {test_movie.vote_average}/10")
     print("\nSimilar Movies:\n")
 
     # Get similar movies
-    similar = engine.get_similar_movies(test_movie.id, top_n=5)
+    similar = engine.get_similar_movies(db, test_movie.id, top_n=5)
 
     for i, movie in enumerate(similar, 1):
         print(f"{i}. {movie['title']} ({movie['release_year']})")
@@ -47,11 +49,11 @@ def main():
         print()
 
     # Test trending recommendations
-    print("\n" + "="*60)
+    print(f"\n{BANNER}")
     print("TRENDING MOVIES")
-    print("="*60 + "\n")
+    print(f"{BANNER}\n")
 
-    trending = engine.get_trending_recommendations(top_n=5)
+    trending = engine.get_trending_recommendations(db, top_n=5)
 
     for i, movie in enumerate(trending, 1):
         print(f"{i}. {movie['title']} ({movie['release_year']})")